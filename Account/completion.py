@@ -0,0 +1,60 @@
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from .models import About, Education, Experience, GoogleUser, Project, Resume, Skill
+
+# Profile section -> (bit in GoogleUser.profile_sections, model, field pointing at the user)
+SECTIONS = {
+    'about': (1, About, 'user'),
+    'education': (2, Education, 'user'),
+    'experience': (4, Experience, 'user'),
+    'skills': (8, Skill, 'user'),
+    'projects': (16, Project, 'user'),
+    'resume': (32, Resume, 'candidate'),
+}
+SECTION_FOR_MODEL = {model: name for name, (_, model, _) in SECTIONS.items()}
+
+
+def completion_for(mask):
+    """Percentage of sections present in ``mask``, each section weighted equally."""
+    filled = sum(1 for bit, _, _ in SECTIONS.values() if mask & bit)
+    return filled * 100 // len(SECTIONS)
+
+
+def _set_section(user_id, section, present):
+    bit = SECTIONS[section][0]
+    with transaction.atomic():
+        mask = (
+            GoogleUser.objects.select_for_update()
+            .filter(pk=user_id)
+            .values_list('profile_sections', flat=True)
+            .first()
+        )
+        # Gone (cascading delete) or already in the right state
+        if mask is None or bool(mask & bit) == present:
+            return
+        mask = mask | bit if present else mask & ~bit
+        GoogleUser.objects.filter(pk=user_id).update(profile_sections=mask, profile_completion=completion_for(mask))
+
+
+def section_added(user_id, section):
+    _set_section(user_id, section, True)
+
+
+def section_removed(user_id, section):
+    """Clear ``section`` for the user once their last row of it is gone."""
+    _, model, user_field = SECTIONS[section]
+    if not model.objects.filter(**{f'{user_field}_id': user_id}).exists():
+        _set_section(user_id, section, False)
+
+
+def annotate_sections(queryset):
+    """``queryset`` with a ``has_<section>`` EXISTS annotation per section, for bulk recomputes."""
+    return queryset.annotate(**{
+        f'has_{name}': Exists(model.objects.filter(**{user_field: OuterRef('pk')}))
+        for name, (_, model, user_field) in SECTIONS.items()
+    })
+
+
+def mask_from_row(row):
+    return sum(bit for name, (bit, _, _) in SECTIONS.items() if row[f'has_{name}'])
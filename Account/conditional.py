@@ -0,0 +1,75 @@
+import hashlib
+from calendar import timegm
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .stats import get_candidate_stats
+
+
+def make_etag(*parts):
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def conditional_response(validator):
+    """
+    Conditional GET for a view method.
+
+    ``validator(view, request, *args, **kwargs)`` returns ``(etag, last_modified)``
+    from something cheap (a column, an aggregate, a cache entry). When the
+    client's ``If-None-Match``/``If-Modified-Since`` still match, a 304 is
+    returned without running the view or its serializer.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return method(view, request, *args, **kwargs)
+
+            etag, last_modified = validator(view, request, *args, **kwargs)
+            etag = quote_etag(etag) if etag else None
+            timestamp = timegm(last_modified.utctimetuple()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                if etag:
+                    response['ETag'] = etag
+                if timestamp is not None:
+                    response['Last-Modified'] = http_date(timestamp)
+            # Payloads differ per signed-in user
+            patch_vary_headers(response, ['Authorization'])
+            return response
+        return wrapper
+    return decorator
+
+
+def user_fields_etag(request, user):
+    return make_etag(
+        request.path, user.pk, user.name, user.email, user.picture, user.user_name,
+        str(user.user_picture), user.job_role,
+    )
+
+
+def current_user_validator(view, request, *args, **kwargs):
+    # The user row is already loaded by authentication, no query needed
+    return user_fields_etag(request, request.user), None
+
+
+def profile_info_validator(view, request, *args, **kwargs):
+    user = request.user
+    if hasattr(user, 'company_profile'):
+        profile = user.company_profile
+        etag = make_etag(request.path, profile.pk, profile.updated_at, profile.name, str(profile.logo))
+        return etag, profile.updated_at
+    return user_fields_etag(request, user), None
+
+
+def candidate_stats_validator(view, request, *args, **kwargs):
+    # Counts come from the per-candidate stats cache, so a 304 costs no query
+    user = request.user
+    stats = get_candidate_stats(user)
+    return make_etag(user_fields_etag(request, user), stats, user.profile_completion), None
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from Account.completion import SECTIONS, annotate_sections, completion_for, mask_from_row
+from Account.models import GoogleUser
+
+
+class Command(BaseCommand):
+    help = "Recompute GoogleUser.profile_sections/profile_completion from the profile section tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        rows = (
+            annotate_sections(GoogleUser.objects.order_by('pk'))
+            .values('pk', 'profile_sections', 'profile_completion', *(f'has_{name}' for name in SECTIONS))
+        )
+
+        drifted = []
+        for row in rows.iterator(chunk_size=batch_size):
+            mask = mask_from_row(row)
+            if (mask, completion_for(mask)) != (row['profile_sections'], row['profile_completion']):
+                drifted.append(GoogleUser(pk=row['pk'], profile_sections=mask, profile_completion=completion_for(mask)))
+
+        if options['dry_run']:
+            self.stdout.write(f"{len(drifted)} users have a drifted profile completion.")
+            return
+
+        with transaction.atomic():
+            GoogleUser.objects.bulk_update(
+                drifted, ['profile_sections', 'profile_completion'], batch_size=batch_size
+            )
+        self.stdout.write(self.style.SUCCESS(f"Recomputed profile completion for {len(drifted)} users."))
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:31
+
+import django.db.models.deletion
+import re
+
+from django.db import migrations, models
+
+
+def link_existing_skills(apps, schema_editor):
+    Skill = apps.get_model('Account', 'Skill')
+    SkillTag = apps.get_model('Account', 'SkillTag')
+
+    tags = {}
+    for skill in Skill.objects.filter(tag__isnull=True).iterator():
+        # Same rules as Account.skills.normalize_skill_name: keep leading dots (".NET")
+        normalized = re.sub(r'\s+', ' ', skill.skill_name).lstrip(' -*\t').rstrip(' .\t').lower()
+        if not normalized or len(normalized) > 100:
+            continue
+        if normalized not in tags:
+            tags[normalized], _ = SkillTag.objects.get_or_create(
+                normalized_name=normalized, defaults={'name': skill.skill_name.strip()}
+            )
+        skill.tag = tags[normalized]
+        skill.save(update_fields=['tag'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0011_profileview'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('normalized_name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='tag',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='candidate_skills', to='Account.skilltag'),
+        ),
+        migrations.RunPython(link_existing_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0012_skill_tags'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='profileview',
+            options={},
+        ),
+        # Composite index first, so candidate lookups are never left unindexed
+        migrations.AddIndex(
+            model_name='profileview',
+            index=models.Index(fields=['candidate', 'viewed_at'], name='profileview_candidate_time_idx'),
+        ),
+        migrations.AlterField(
+            model_name='profileview',
+            name='candidate',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='profile_views', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='profileview',
+            name='viewed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:57
+
+from django.db import migrations, models
+from django.db.models import Exists, F, OuterRef
+
+# Frozen copy of Account.completion.SECTIONS
+SECTIONS = [
+    (1, 'About', 'user'),
+    (2, 'Education', 'user'),
+    (4, 'Experience', 'user'),
+    (8, 'Skill', 'user'),
+    (16, 'Project', 'user'),
+    (32, 'Resume', 'candidate'),
+]
+
+
+def backfill_profile_completion(apps, schema_editor):
+    GoogleUser = apps.get_model('Account', 'GoogleUser')
+    for bit, model_name, user_field in SECTIONS:
+        rows = apps.get_model('Account', model_name).objects.filter(**{user_field: OuterRef('pk')})
+        GoogleUser.objects.filter(Exists(rows)).update(profile_sections=F('profile_sections').bitor(bit))
+
+    # At most 2**6 distinct masks, one UPDATE each
+    for mask in set(GoogleUser.objects.values_list('profile_sections', flat=True).distinct()):
+        filled = sum(1 for bit, _, _ in SECTIONS if mask & bit)
+        GoogleUser.objects.filter(profile_sections=mask).update(profile_completion=filled * 100 // len(SECTIONS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0014_profile_view_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='googleuser',
+            name='profile_completion',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='googleuser',
+            name='profile_sections',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_profile_completion, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:09
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_viewed_at(apps, schema_editor):
+    # Existing rows are long committed; their view time stands in for the insert time
+    apps.get_model('Account', 'ProfileView').objects.update(created_at=F('viewed_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0015_profile_completion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profileview',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_viewed_at, migrations.RunPython.noop),
+    ]
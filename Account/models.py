@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin,BaseUserManager
 from django.conf import settings
+from django.utils import timezone
 
 class GoogleUserManager(BaseUserManager):
     def create_user(self, email, name, password=None, user_type='candidate', **extra_fields):
@@ -43,6 +44,11 @@ class GoogleUser(AbstractBaseUser,PermissionsMixin):
     user_picture = models.ImageField(upload_to="profile_pics/", blank=True, null=True)
     job_role = models.CharField(max_length=100, blank=True, null=True)
 
+    # Which profile sections exist (bits in Account.completion.SECTIONS) and the
+    # resulting percentage, kept current by signals on the section models
+    profile_sections = models.PositiveSmallIntegerField(default=0, editable=False)
+    profile_completion = models.PositiveSmallIntegerField(default=0, editable=False)
+
     # Django admin fields
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
@@ -84,9 +90,18 @@ class Experience(models.Model):
     class Meta:
         unique_together = ('user', 'company_name', 'position_name', 'start_year', 'end_year','description')    
 
+class SkillTag(models.Model):
+    """Canonical skill shared by candidate skills and job requirements."""
+    name = models.CharField(max_length=100)
+    normalized_name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
 class Skill(models.Model):
     user = models.ForeignKey(GoogleUser,on_delete=models.CASCADE,related_name="skill")
     skill_name = models.CharField(max_length=300)
+    tag = models.ForeignKey(SkillTag, on_delete=models.SET_NULL, null=True, blank=True, related_name="candidate_skills")
 
     class Meta:
         unique_together = ('user','skill_name')
@@ -114,10 +129,12 @@ class Resume(models.Model):
 
 
 class ProfileView(models.Model):
+    # Covered by profileview_candidate_time_idx
     candidate = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
-        related_name="profile_views"
+        related_name="profile_views",
+        db_index=False,
     )
     viewer = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -126,10 +143,45 @@ class ProfileView(models.Model):
         blank=True,
         related_name="viewed_profiles"
     )
-    viewed_at = models.DateTimeField(auto_now_add=True)
+    # Set by the ingestion buffer (Account.profile_views), not at insert time
+    viewed_at = models.DateTimeField(default=timezone.now)
+    # Insert time, which bounds how far the daily rollup may read (Account.rollups)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['-viewed_at']
+        # No default ordering: counts and range scans don't pay for a sort
+        indexes = [
+            models.Index(fields=['candidate', 'viewed_at'], name='profileview_candidate_time_idx'),
+        ]
 
     def __str__(self):
         return f"{self.viewer} viewed {self.candidate}"
+
+
+class ProfileViewDaily(models.Model):
+    """Profile views per candidate and day, rolled up from ProfileView by Account.rollups."""
+    # Covered by the (candidate, day) unique constraint
+    candidate = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile_view_days", db_index=False
+    )
+    day = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    unique_viewers = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['candidate', 'day'], name='profileviewdaily_candidate_day_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate_id} on {self.day}: {self.views} views"
+
+
+class RollupWatermark(models.Model):
+    """Last source row id an incremental rollup has processed."""
+    name = models.CharField(max_length=50, unique=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.position}"
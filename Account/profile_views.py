@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from Recruiter_Account.cache import bump_candidate_version, get_redis_client
+from .models import GoogleUser, ProfileView
+
+
+class LocalViewBuffer:
+    """
+    Pending views of this process, flushed inline by the request that finds
+    the buffer due (old or large enough) when there is no shared store.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+    def add(self, view):
+        with self.lock:
+            self.pending.append(view)
+            due = (
+                len(self.pending) >= settings.PROFILE_VIEW_BATCH_SIZE
+                or time.monotonic() - self.last_flush >= settings.PROFILE_VIEW_FLUSH_INTERVAL
+            )
+        if due:
+            flush_profile_views()
+
+    def drain(self):
+        with self.lock:
+            pending, self.pending = self.pending, []
+            self.last_flush = time.monotonic()
+        return pending
+
+
+class RedisViewBuffer:
+    """Pending views of all processes in one Redis list, drained by the periodic flush task."""
+    KEY = 'profile-views:pending'
+
+    def client(self):
+        return get_redis_client()
+
+    def add(self, view):
+        candidate_id, viewer_id, viewed_at = view
+        self.client().rpush(self.KEY, json.dumps([candidate_id, viewer_id, viewed_at.isoformat()]))
+
+    def drain(self):
+        client = self.client()
+        # RENAME is atomic: views pushed after this point start a fresh list
+        draining = f'{self.KEY}:draining:{uuid.uuid4().hex}'
+        try:
+            client.rename(self.KEY, draining)
+        except redis.ResponseError:  # nothing buffered
+            return []
+        raw = client.lrange(draining, 0, -1)
+        client.delete(draining)
+        return [
+            (candidate_id, viewer_id, datetime.fromisoformat(viewed_at))
+            for candidate_id, viewer_id, viewed_at in map(json.loads, raw)
+        ]
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_view_buffer():
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = RedisViewBuffer() if settings.PROFILE_VIEW_BUFFER == 'redis' else LocalViewBuffer()
+        return _buffer
+
+
+def record_profile_view(candidate_id, viewer_id):
+    """
+    Log that ``viewer_id`` looked at ``candidate_id``'s profile.
+
+    Repeat views by the same viewer within PROFILE_VIEW_DEDUPE_WINDOW seconds
+    are dropped with a single cache.add(); the rest are buffered and written
+    in batches. Returns whether the view was counted.
+    """
+    if candidate_id == viewer_id:
+        return False
+    window_key = f'profile-view:{candidate_id}:{viewer_id}'
+    if not cache.add(window_key, 1, timeout=settings.PROFILE_VIEW_DEDUPE_WINDOW):
+        return False
+    get_view_buffer().add((candidate_id, viewer_id, timezone.now()))
+    return True
+
+
+def flush_profile_views():
+    """Write buffered views with bulk_create and invalidate the candidates' cached stats."""
+    pending = get_view_buffer().drain()
+    if not pending:
+        return 0
+
+    # Ingestion never queried; users deleted or mistyped since then would fail the foreign keys
+    user_ids = {view[0] for view in pending} | {view[1] for view in pending if view[1]}
+    existing = set(GoogleUser.objects.filter(id__in=user_ids).values_list('id', flat=True))
+    views = [
+        ProfileView(
+            candidate_id=candidate_id,
+            viewer_id=viewer_id if viewer_id in existing else None,
+            viewed_at=viewed_at,
+        )
+        for candidate_id, viewer_id, viewed_at in pending if candidate_id in existing
+    ]
+    ProfileView.objects.bulk_create(views, batch_size=settings.PROFILE_VIEW_BATCH_SIZE)
+
+    # bulk_create sends no post_save
+    for candidate_id in {view.candidate_id for view in views}:
+        bump_candidate_version(candidate_id)
+    return len(views)
@@ -0,0 +1,145 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import ProfileView, ProfileViewDaily, RollupWatermark
+
+PROFILE_VIEW_WATERMARK = 'profile_view_daily'
+
+
+def get_watermark(name):
+    return RollupWatermark.objects.filter(name=name).values_list('position', flat=True).first() or 0
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def rollup_profile_views(batch_size=None, grace=None):
+    """
+    Fold ProfileView rows past the watermark into ProfileViewDaily.
+
+    Each batch finds the (candidate, day) cells its new events fall in and
+    recomputes those cells from the raw events, so ``unique_viewers`` stays
+    exact across batches. The cells and the new watermark are written in
+    one transaction. Returns the number of events processed.
+
+    Ids are handed out before the inserting transaction commits, so a
+    lower id can still become visible after a higher one. The run only
+    reads up to the newest row inserted more than
+    PROFILE_VIEW_ROLLUP_GRACE seconds ago; anything below it has had time
+    to commit and will not be skipped by the watermark.
+    """
+    batch_size = batch_size or settings.PROFILE_VIEW_ROLLUP_BATCH_SIZE
+    grace = settings.PROFILE_VIEW_ROLLUP_GRACE if grace is None else grace
+    settled = ProfileView.objects.filter(created_at__lt=timezone.now() - timedelta(seconds=grace))
+    upper = settled.order_by('-id').values_list('id', flat=True).first() or 0
+    processed = 0
+
+    while True:
+        with transaction.atomic():
+            watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(name=PROFILE_VIEW_WATERMARK)
+            start = watermark.position
+            if start >= upper:
+                break
+            end = min(start + batch_size, upper)
+
+            new_events = ProfileView.objects.filter(id__gt=start, id__lte=end).order_by()
+            cells = set(
+                new_events.annotate(day=TruncDate('viewed_at')).values_list('candidate_id', 'day').distinct()
+            )
+            if cells:
+                candidates = {candidate for candidate, _ in cells}
+                days = {day for _, day in cells}
+                # The rectangle covering every touched cell, recomputed from the raw events up to the
+                # new watermark (later ones are still counted as pending by the readers)
+                totals = (
+                    ProfileView.objects.filter(
+                        id__lte=end,
+                        candidate_id__in=candidates,
+                        viewed_at__gte=_day_start(min(days)),
+                        viewed_at__lt=_day_start(max(days) + timedelta(days=1)),
+                    )
+                    .order_by()
+                    .annotate(day=TruncDate('viewed_at'))
+                    .values('candidate_id', 'day')
+                    .annotate(views=Count('id'), unique_viewers=Count('viewer', distinct=True))
+                )
+                ProfileViewDaily.objects.bulk_create(
+                    [ProfileViewDaily(**row) for row in totals if (row['candidate_id'], row['day']) in cells],
+                    update_conflicts=True,
+                    unique_fields=['candidate', 'day'],
+                    update_fields=['views', 'unique_viewers'],
+                )
+                processed += new_events.count()
+
+            watermark.position = end
+            watermark.save(update_fields=['position', 'updated_at'])
+    return processed
+
+
+def purge_profile_views(retention_days=None, chunk_size=None):
+    """
+    Delete raw ProfileView rows older than the retention period, in chunks.
+
+    Only rows already folded into the rollup are removed. The DELETE is
+    issued directly: the rows no longer change any count (totals read the
+    rollup), so there is nothing for the delete signals to invalidate.
+    """
+    retention_days = retention_days or settings.PROFILE_VIEW_RETENTION_DAYS
+    chunk_size = chunk_size or settings.PROFILE_VIEW_PURGE_CHUNK_SIZE
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    expired = ProfileView.objects.filter(
+        viewed_at__lt=cutoff, id__lte=get_watermark(PROFILE_VIEW_WATERMARK)
+    ).order_by('id')
+
+    table = connection.ops.quote_name(ProfileView._meta.db_table)
+    deleted = 0
+    while True:
+        ids = list(expired.values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table} WHERE id IN ({", ".join(["%s"] * len(ids))})', ids)
+            deleted += cursor.rowcount
+
+
+def profile_view_series(candidate_id, days):
+    """
+    ``[{'day', 'views', 'unique_viewers'}]`` for the last ``days`` days, oldest
+    first and zero-filled. Days are read from the rollup; events it has not
+    reached yet are added on top so the chart matches the total count.
+    """
+    today = timezone.localdate()
+    first_day = today - timedelta(days=days - 1)
+    series = {
+        first_day + timedelta(days=offset): {'views': 0, 'unique_viewers': 0} for offset in range(days)
+    }
+
+    rolled = ProfileViewDaily.objects.filter(candidate_id=candidate_id, day__gte=first_day)
+    for day, views, unique_viewers in rolled.values_list('day', 'views', 'unique_viewers'):
+        if day in series:
+            series[day] = {'views': views, 'unique_viewers': unique_viewers}
+
+    pending = (
+        ProfileView.objects.filter(
+            candidate_id=candidate_id,
+            id__gt=get_watermark(PROFILE_VIEW_WATERMARK),
+            viewed_at__gte=_day_start(first_day),
+        )
+        .order_by()
+        .annotate(day=TruncDate('viewed_at'))
+        .values('day')
+        .annotate(views=Count('id'), unique_viewers=Count('viewer', distinct=True))
+    )
+    for row in pending:
+        if row['day'] in series:
+            # Viewers may overlap with the rolled-up part of the day; the sum is an upper bound
+            series[row['day']]['views'] += row['views']
+            series[row['day']]['unique_viewers'] += row['unique_viewers']
+
+    return [{'day': day, **counts} for day, counts in sorted(series.items())]
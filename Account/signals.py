@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from Recruiter_Account.cache import bump_candidate_version
+from .completion import SECTION_FOR_MODEL, SECTIONS, section_added, section_removed
+from .models import ProfileView, Skill
+from .skills import MAX_SKILL_LENGTH, normalize_skill_name, resolve_skill_tags
+
+
+@receiver(pre_save, sender=Skill)
+def link_skill_tag(sender, instance, **kwargs):
+    normalized = normalize_skill_name(instance.skill_name)
+    if instance.tag_id is None and normalized and len(normalized) <= MAX_SKILL_LENGTH:
+        instance.tag = resolve_skill_tags({normalized: instance.skill_name.strip()})[normalized]
+
+
+@receiver(post_save, sender=ProfileView)
+@receiver(post_delete, sender=ProfileView)
+def invalidate_candidate_stats(sender, instance, **kwargs):
+    bump_candidate_version(instance.candidate_id)
+
+
+def _section_user_id(instance):
+    return getattr(instance, f'{SECTIONS[SECTION_FOR_MODEL[type(instance)]][2]}_id')
+
+
+def update_completion_on_save(sender, instance, created, **kwargs):
+    if created:
+        section_added(_section_user_id(instance), SECTION_FOR_MODEL[sender])
+
+
+def update_completion_on_delete(sender, instance, **kwargs):
+    section_removed(_section_user_id(instance), SECTION_FOR_MODEL[sender])
+
+
+for section_model in SECTION_FOR_MODEL:
+    post_save.connect(update_completion_on_save, sender=section_model, dispatch_uid=f'completion-save-{section_model.__name__}')
+    post_delete.connect(update_completion_on_delete, sender=section_model, dispatch_uid=f'completion-delete-{section_model.__name__}')
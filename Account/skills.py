@@ -0,0 +1,50 @@
+import re
+
+from .models import SkillTag
+
+# Separators used in free-text skill lists ("Python, Django; SQL | AWS")
+SKILL_SEPARATORS = re.compile(r'[,;|\n\r•·]+')
+
+MAX_SKILL_LENGTH = SkillTag._meta.get_field('normalized_name').max_length
+
+
+def clean_skill_name(name):
+    """Collapse whitespace and drop list bullets and trailing full stops, keeping ".NET"-style punctuation."""
+    return re.sub(r'\s+', ' ', name).lstrip(' -*\t').rstrip(' .\t')
+
+
+def normalize_skill_name(name):
+    return clean_skill_name(name).lower()
+
+
+def parse_skills(text):
+    """Split a free-text skill list into ``{normalized_name: display_name}``, in order."""
+    skills = {}
+    for part in SKILL_SEPARATORS.split(text or ''):
+        display = clean_skill_name(part)
+        normalized = normalize_skill_name(display)
+        if normalized and len(normalized) <= MAX_SKILL_LENGTH:
+            skills.setdefault(normalized, display)
+    return skills
+
+
+def resolve_skill_tags(skills):
+    """
+    Map ``{normalized_name: display_name}`` to SkillTag rows, creating the
+    missing ones in bulk. Returns ``{normalized_name: SkillTag}``.
+    """
+    if not skills:
+        return {}
+
+    tags = {tag.normalized_name: tag for tag in SkillTag.objects.filter(normalized_name__in=skills)}
+    missing = [name for name in skills if name not in tags]
+    if missing:
+        SkillTag.objects.bulk_create(
+            [SkillTag(name=skills[name], normalized_name=name) for name in missing],
+            ignore_conflicts=True,
+        )
+        tags.update(
+            (tag.normalized_name, tag)
+            for tag in SkillTag.objects.filter(normalized_name__in=missing)
+        )
+    return tags
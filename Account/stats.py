@@ -0,0 +1,58 @@
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from Recruiter_Account.cache import cached_candidate_payload
+from Recruiter_Account.models import JobApplication
+from .models import GoogleUser, ProfileView, ProfileViewDaily, RollupWatermark
+from .rollups import PROFILE_VIEW_WATERMARK
+
+
+def _count(queryset, **filters):
+    counts = (
+        queryset.filter(candidate=OuterRef('pk'))
+        .order_by()
+        .values('candidate')
+        .annotate(total=Count('id', filter=Q(**filters)))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _profile_views_total():
+    """Rolled-up daily views plus the raw events the rollup has not reached yet."""
+    rolled = (
+        ProfileViewDaily.objects.filter(candidate=OuterRef('pk'))
+        .order_by()
+        .values('candidate')
+        .annotate(total=Sum('views'))
+        .values('total')
+    )
+    watermark = RollupWatermark.objects.filter(name=PROFILE_VIEW_WATERMARK).values('position')
+    pending = ProfileView.objects.filter(id__gt=Coalesce(Subquery(watermark), 0))
+    return Coalesce(Subquery(rolled, output_field=IntegerField()), 0) + _count(pending)
+
+
+def compute_candidate_stats(candidate_id):
+    """Applications, interviews and profile views for a candidate, as one SELECT of scalar subqueries."""
+    row = (
+        GoogleUser.objects.filter(pk=candidate_id)
+        .annotate(
+            applied_total=_count(JobApplication.objects.all()),
+            interviewed_total=_count(JobApplication.objects.all(), status='interviewed'),
+            views_total=_profile_views_total(),
+        )
+        .values_list('applied_total', 'interviewed_total', 'views_total')
+        .first()
+    )
+    total_applied, interviewed, profile_views = row or (0, 0, 0)
+    return {
+        'total_applied': total_applied,
+        'interviewed': interviewed,
+        'profile_views': profile_views,
+        'success_rate': round(interviewed / total_applied * 100, 1) if total_applied else 0,
+    }
+
+
+def get_candidate_stats(user):
+    """Stats for ``user``, cached until one of their applications or profile views changes."""
+    return cached_candidate_payload(user.pk, 'stats', lambda: compute_candidate_stats(user.pk))
@@ -0,0 +1,22 @@
+from celery import shared_task
+
+from .profile_views import flush_profile_views
+from .rollups import purge_profile_views, rollup_profile_views
+
+
+@shared_task
+def flush_profile_view_buffer():
+    """Write buffered profile views to ProfileView."""
+    return flush_profile_views()
+
+
+@shared_task
+def rollup_profile_view_days():
+    """Fold new ProfileView rows into ProfileViewDaily."""
+    return rollup_profile_views()
+
+
+@shared_task
+def purge_old_profile_views():
+    """Delete raw ProfileView rows past PROFILE_VIEW_RETENTION_DAYS."""
+    return purge_profile_views()
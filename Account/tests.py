@@ -1,3 +1,260 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from Recruiter_Account.models import CompanyProfile, Job, JobApplication
+from Recruiter_Account.recommendations import JobFeatureIndex, get_job_index
+from .models import About, Experience, GoogleUser, ProfileView, ProfileViewDaily, Resume, Skill
+from .profile_views import flush_profile_views, get_view_buffer
+from .rollups import purge_profile_views, rollup_profile_views
+from .stats import compute_candidate_stats
+
+
+def make_job(company, title, skills_required="", **fields):
+    return Job.objects.create(
+        company=company, title=title, location="Chennai",
+        skills_required=skills_required, job_slug=f"{title}-{Job.objects.count()}", **fields
+    )
+
+
+class RecommendationTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        recruiter = GoogleUser.objects.create_user(
+            email="r@example.com", name="Recruiter", password="secret123", user_type="recruiter"
+        )
+        company = CompanyProfile.objects.create(recruiter=recruiter, name="Acme")
+        self.backend = make_job(company, "Backend Developer", "Python, Django, SQL", experience_required="2 years")
+        self.frontend = make_job(company, "Frontend Developer", "React, CSS")
+        self.closed = make_job(company, "Python Lead", "Python, Django", is_active=False)
+
+        self.candidate = GoogleUser.objects.create_user(
+            email="c@example.com", name="Candidate", job_role="Backend Engineer"
+        )
+        Skill.objects.create(user=self.candidate, skill_name="python")
+        Skill.objects.create(user=self.candidate, skill_name="Django")
+        Experience.objects.create(
+            user=self.candidate, company_name="X", position_name="Developer",
+            start_year=2020, end_year=2023, description="",
+        )
+        self.client.force_authenticate(self.candidate)
+
+    def test_ranks_matching_active_jobs_first(self):
+        response = self.client.get("/api/candidate/recommendations/")
+        self.assertEqual(response.status_code, 200)
+        ids = [item["job"]["id"] for item in response.json()]
+        self.assertEqual(ids, [self.backend.id, self.frontend.id])
+        self.assertGreater(response.json()[0]["score"], response.json()[1]["score"])
+
+    def test_skips_jobs_already_applied_to(self):
+        JobApplication.objects.create(job=self.backend, candidate=self.candidate)
+        ids = [item["job"]["id"] for item in self.client.get("/api/candidate/recommendations/").json()]
+        self.assertEqual(ids, [self.frontend.id])
+
+    def test_index_is_rebuilt_for_job_edits_only(self):
+        self.client.get("/api/candidate/recommendations/")
+        index = get_job_index()
+        other = GoogleUser.objects.create_user(email="other@example.com", name="Other")
+        JobApplication.objects.create(job=self.backend, candidate=other)
+        self.assertIs(get_job_index(), index)
+
+        self.frontend.is_active = False
+        self.frontend.save()
+        self.assertIsNot(get_job_index(), index)
+        ids = [item["job"]["id"] for item in self.client.get("/api/candidate/recommendations/").json()]
+        self.assertEqual(ids, [self.backend.id])
+
+
+    def test_closed_jobs_are_dropped_from_a_stale_index(self):
+        self.client.get("/api/candidate/recommendations/")
+        Job.objects.filter(pk=self.frontend.pk).update(is_active=False)  # no signal, index stays stale
+        ids = [item["job"]["id"] for item in self.client.get("/api/candidate/recommendations/").json()]
+        self.assertEqual(ids, [self.backend.id])
+
+    def test_links_to_jobs_missing_from_the_snapshot_are_dropped(self):
+        jobs = [(2, "Python Developer", "", ""), (5, "Designer", "", "")]
+        index = JobFeatureIndex.from_rows(jobs, [(2, 1), (3, 7), (5, 2), (9, 7)])
+        self.assertEqual(index.skill_rows.tolist(), [0, 1])
+        self.assertEqual(len(index.score([7], set(), 0.0)), 2)
+
+
+class CandidateStatsTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        recruiter = GoogleUser.objects.create_user(
+            email="r@example.com", name="Recruiter", password="secret123", user_type="recruiter"
+        )
+        company = CompanyProfile.objects.create(recruiter=recruiter, name="Acme")
+        self.candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.applications = [
+            JobApplication.objects.create(job=make_job(company, f"Job {i}"), candidate=self.candidate, status=status)
+            for i, status in enumerate(["applied", "interviewed", "applied", "rejected"])
+        ]
+        ProfileView.objects.create(candidate=self.candidate, viewer=recruiter)
+        self.client.force_authenticate(self.candidate)
+
+    def test_dashboard_and_milestones_share_one_query(self):
+        with self.assertNumQueries(1):
+            dashboard = self.client.get("/api/candidate/apply_count/").json()
+            milestones = self.client.get("/api/candidate/badges/").json()
+        self.assertEqual(
+            [dashboard[key] for key in ("total_applied", "profile_views", "interviewed", "success_rate")],
+            [4, 1, 1, 25.0],
+        )
+        self.assertEqual(milestones["total_applied"]["value"], 4)
+
+    def test_invalidated_by_status_changes_and_profile_views(self):
+        self.client.get("/api/candidate/apply_count/")
+        application = JobApplication.objects.get(pk=self.applications[0].pk)
+        application.status = "interviewed"
+        application.save()
+        ProfileView.objects.create(candidate=self.candidate)
+
+        dashboard = self.client.get("/api/candidate/apply_count/").json()
+        self.assertEqual((dashboard["interviewed"], dashboard["profile_views"]), (2, 2))
+
+
+@override_settings(PROFILE_VIEW_FLUSH_INTERVAL=3600, PROFILE_VIEW_BATCH_SIZE=3)
+class ProfileViewIngestionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        get_view_buffer().drain()
+        self.client = APIClient()
+        self.candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.recruiters = []
+        for i in range(3):
+            recruiter = GoogleUser.objects.create_user(
+                email=f"r{i}@example.com", name="Recruiter", password="secret123", user_type="recruiter"
+            )
+            CompanyProfile.objects.create(recruiter=recruiter, name=f"Company {i}")
+            self.recruiters.append(recruiter)
+
+    def view(self, recruiter, candidate_id=None):
+        self.client.force_authenticate(recruiter)
+        return self.client.post(f"/api/candidate/{candidate_id or self.candidate.id}/view/")
+
+    def test_dedupes_within_window_and_buffers(self):
+        self.assertTrue(self.view(self.recruiters[0]).json()["counted"])
+        self.assertFalse(self.view(self.recruiters[0]).json()["counted"])
+        self.view(self.recruiters[1])
+        self.assertFalse(ProfileView.objects.exists())
+
+        self.assertEqual(flush_profile_views(), 2)
+        self.assertEqual(
+            set(ProfileView.objects.values_list("viewer_id", flat=True)),
+            {self.recruiters[0].id, self.recruiters[1].id},
+        )
+
+    def test_full_batch_flushes_inline(self):
+        self.view(self.recruiters[0], candidate_id=999999)  # unknown users are dropped at flush
+        self.view(self.recruiters[1])
+        self.view(self.recruiters[2])
+        self.assertEqual(ProfileView.objects.filter(candidate=self.candidate).count(), 2)
+
+    def test_candidates_cannot_log_views(self):
+        self.assertEqual(self.view(self.candidate).status_code, 403)
+
+
+@override_settings(PROFILE_VIEW_ROLLUP_GRACE=0)
+class ProfileViewRollupTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.viewers = [
+            GoogleUser.objects.create_user(email=f"r{i}@example.com", name="Recruiter") for i in range(2)
+        ]
+        now = timezone.now()
+        self.today, self.yesterday = timezone.localdate(), timezone.localdate() - timedelta(days=1)
+        for viewer, viewed_at in [
+            (self.viewers[0], now - timedelta(days=1)),
+            (self.viewers[0], now),
+            (self.viewers[0], now),
+            (self.viewers[1], now),
+            (self.viewers[0], now - timedelta(days=200)),
+        ]:
+            ProfileView.objects.create(candidate=self.candidate, viewer=viewer, viewed_at=viewed_at)
+
+    def test_incremental_rollup_matches_raw_counts(self):
+        self.assertEqual(rollup_profile_views(batch_size=2), 5)
+        today = ProfileViewDaily.objects.get(candidate=self.candidate, day=self.today)
+        self.assertEqual((today.views, today.unique_viewers), (3, 2))
+
+        # Only events past the watermark are processed
+        ProfileView.objects.create(candidate=self.candidate, viewer=self.viewers[1])
+        self.assertEqual(compute_candidate_stats(self.candidate.pk)["profile_views"], 6)
+        self.assertEqual(rollup_profile_views(), 1)
+        self.assertEqual(rollup_profile_views(), 0)
+        today.refresh_from_db()
+        self.assertEqual((today.views, today.unique_viewers), (4, 2))
+        self.assertEqual(compute_candidate_stats(self.candidate.pk)["profile_views"], 6)
+
+    def test_recent_inserts_wait_for_the_grace_window(self):
+        rollup_profile_views()
+        # Inserted after a lower id that may not have committed yet
+        recent = ProfileView.objects.create(candidate=self.candidate, viewer=self.viewers[1])
+
+        self.assertEqual(rollup_profile_views(grace=60), 0)
+        self.assertEqual(compute_candidate_stats(self.candidate.pk)["profile_views"], 6)
+        ProfileView.objects.filter(pk=recent.pk).update(created_at=timezone.now() - timedelta(minutes=2))
+        self.assertEqual(rollup_profile_views(grace=60), 1)
+        self.assertEqual(compute_candidate_stats(self.candidate.pk)["profile_views"], 6)
+
+    def test_series_is_zero_filled_and_includes_pending_events(self):
+        rollup_profile_views()
+        ProfileView.objects.create(candidate=self.candidate, viewer=self.viewers[1])
+        self.client.force_authenticate(self.candidate)
+        series = self.client.get("/api/candidate/profile-views/?days=3").json()
+        self.assertEqual([point["views"] for point in series], [0, 1, 4])
+        self.assertEqual(series[-1]["day"], self.today.isoformat())
+
+    def test_retention_only_purges_rolled_up_events(self):
+        old = ProfileView.objects.get(viewed_at__lt=timezone.now() - timedelta(days=100))
+        self.assertEqual(purge_profile_views(retention_days=90), 0)
+
+        rollup_profile_views()
+        self.assertEqual(purge_profile_views(retention_days=90, chunk_size=1), 1)
+        self.assertFalse(ProfileView.objects.filter(pk=old.pk).exists())
+        self.assertEqual(compute_candidate_stats(self.candidate.pk)["profile_views"], 5)
+
+
+class ProfileCompletionTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.client.force_authenticate(self.candidate)
+
+    def completion(self):
+        self.candidate.refresh_from_db()
+        return self.candidate.profile_completion
+
+    def test_sections_tracked_incrementally(self):
+        About.objects.create(user=self.candidate, description="Hello")
+        self.client.post("/api/add/skill/", ["Python", "Django"], format="json")  # bulk_create path
+        Resume.objects.create(candidate=self.candidate, file="resumes/cv.pdf")
+        self.assertEqual(self.completion(), 50)
+
+        skills = list(Skill.objects.filter(user=self.candidate))
+        skills[0].delete()
+        self.assertEqual(self.completion(), 50)
+        skills[1].delete()
+        self.assertEqual(self.completion(), 33)
+
+        milestones = self.client.get("/api/candidate/badges/").json()
+        self.assertEqual(milestones["profile_completion"]["value"], 33)
+        self.assertEqual(self.client.get("/api/candidate/apply_count/").json()["profile_completion"], 33)
+
+    def test_recompute_command_repairs_drift(self):
+        About.objects.create(user=self.candidate, description="Hello")
+        Experience.objects.create(
+            user=self.candidate, company_name="X", position_name="Dev", start_year=2020, end_year=2021, description="",
+        )
+        GoogleUser.objects.filter(pk=self.candidate.pk).update(profile_sections=0, profile_completion=0)
+
+        call_command("recompute_profile_completion", stdout=StringIO())
+        self.assertEqual(self.completion(), 33)
+        self.assertEqual(self.candidate.profile_sections, 1 | 4)
@@ -26,6 +26,9 @@ urlpatterns = [
 
     path('api/candidate/apply_count/', CandidateDashboardAPIView.as_view(), name='candidate-dashboard'),
     path('api/candidate/badges/', CandidateMilestonesAPIView.as_view(), name='candidate-dashboard'),
+    path('api/candidate/recommendations/', CandidateRecommendationsAPIView.as_view(), name='candidate-recommendations'),
+    path('api/candidate/profile-views/', CandidateProfileViewSeriesAPIView.as_view(), name='candidate-profile-view-series'),
+    path('api/candidate/<int:pk>/view/', CandidateProfileViewAPIView.as_view(), name='candidate-profile-view'),
     path("api/profile-info/", UserProfileInfoView.as_view(), name="user-profile-info"),
 
     path('api/', include(router.urls)), 
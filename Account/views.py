@@ -14,7 +14,17 @@ import json
 from google import genai  # sdk import from google‑genai
 import json
 import re
-from django.db import connection
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from .skills import MAX_SKILL_LENGTH, normalize_skill_name, resolve_skill_tags
+from .stats import get_candidate_stats
+from .profile_views import record_profile_view
+from .completion import section_added
+from .rollups import profile_view_series
+from Recruiter_Account.recommendations import recommend_jobs
+from Recruiter_Account.serializers import JobSerializer
+from Recruiter_Account.models import Job
+from .conditional import conditional_response, current_user_validator, profile_info_validator, candidate_stats_validator
 
 class ServerHealthCheckView(APIView):
     def get(self, request):
@@ -73,6 +83,7 @@ class GoogleLoginAPIView(APIView):
 class CurrentUserAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @conditional_response(current_user_validator)
     def get(self, request):
         serializer = GoogleUserSerializer(request.user,context={'request': request})
         return Response(serializer.data)
@@ -328,17 +339,26 @@ class SkillListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        skills_to_add = []
-        existing_skills = []
-
+        # Submitted names keyed by their normalized (tag) form
+        submitted = {}
         for name in data:
             name = name.strip()
-            if not name:
-                continue
-            if Skill.objects.filter(user=request.user, skill_name__iexact=name).exists():
-                existing_skills.append(name)
-            else:
-                skills_to_add.append(Skill(user=request.user, skill_name=name))
+            if name:
+                submitted.setdefault(normalize_skill_name(name), name)
+
+        # ✅ One lookup: tagged rows match on the tag, untagged ones (legacy or too long to tag) on the name
+        untagged_names = Q()
+        for name in submitted.values():
+            untagged_names |= Q(skill_name__iexact=name)
+        owned_tags, owned_names = set(), set()
+        for tag_name, skill_name in Skill.objects.filter(user=request.user).filter(
+            Q(tag__normalized_name__in=submitted) | (Q(tag__isnull=True) & untagged_names)
+        ).values_list('tag__normalized_name', 'skill_name'):
+            owned_tags.add(tag_name)
+            owned_names.add(skill_name.lower())
+        existing = {key for key, name in submitted.items() if key in owned_tags or name.lower() in owned_names}
+        existing_skills = [submitted[key] for key in existing]
+        new_skills = {key: name for key, name in submitted.items() if key not in existing}
 
         if existing_skills:
             return Response(
@@ -346,8 +366,25 @@ class SkillListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if skills_to_add:
-            Skill.objects.bulk_create(skills_to_add)
+        if new_skills:
+            try:
+                with transaction.atomic():
+                    # Tags are created only for skills that are actually added, and roll back with them
+                    tags = resolve_skill_tags(
+                        {key: name for key, name in new_skills.items() if len(key) <= MAX_SKILL_LENGTH}
+                    )
+                    Skill.objects.bulk_create([
+                        Skill(user=request.user, skill_name=name, tag=tags.get(key))
+                        for key, name in new_skills.items()
+                    ])
+            except IntegrityError:
+                # Added concurrently, or differs from an existing name only in case
+                return Response(
+                    {"detail": "Some of these skills already exist."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # ✅ bulk_create skips post_save, so mark the section here
+            section_added(request.user.pk, 'skills')
             return Response({"message": "Skills added successfully"}, status=status.HTTP_201_CREATED)
         else:
             return Response(
@@ -504,33 +541,19 @@ from .models import ProfileView
 class CandidateDashboardAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @conditional_response(candidate_stats_validator)
     def get(self, request):
         user = request.user
 
-        # 1️⃣ Total jobs applied
-        total_applied = user.job_applications.count()
-
-        # 2️⃣ Total profile views
-        profile_views = ProfileView.objects.filter(candidate=user).count()
-
-        # 3️⃣ Interviewed count
-        interviewed_count = user.job_applications.filter(status='interviewed').count()
+        # 1️⃣-4️⃣ Applied, profile views, interviewed and success rate from the shared cached stats
+        stats = get_candidate_stats(user)
+        total_applied = stats["total_applied"]
+        profile_views = stats["profile_views"]
+        interviewed_count = stats["interviewed"]
+        success_rate = stats["success_rate"]
 
-        # 4️⃣ Success rate = interviewed / total_applied * 100
-        success_rate = round((interviewed_count / total_applied) * 100, 1) if total_applied > 0 else 0
-
-        # 5️⃣ Profile Completion (example logic)
-        profile_fields = [
-            user.name,
-            user.email,
-            getattr(user, 'phone_number', None),
-            getattr(user, 'education', None),
-            getattr(user, 'experience', None),
-            getattr(user, 'skills', None),
-            getattr(user, 'profile_picture', None)
-        ]
-        filled_fields = [f for f in profile_fields if f]  # Count non-empty fields
-        profile_completion = round((len(filled_fields) / len(profile_fields)) * 100, 1)
+        # 5️⃣ Profile Completion, kept on the user row by signals (Account.completion)
+        profile_completion = user.profile_completion
 
         return Response({
             "total_applied": total_applied,
@@ -572,15 +595,17 @@ class CandidateMilestonesAPIView(APIView):
                     return f"{threshold - value}% to next level"
         return "Max level reached"
 
+    @conditional_response(candidate_stats_validator)
     def get(self, request):
         user = request.user
 
-        # ✅ Gather raw values
-        total_applied = user.job_applications.count()
-        profile_views = ProfileView.objects.filter(candidate=user).count()
-        interviewed = user.job_applications.filter(status="interviewed").count()
-        success_rate = round((interviewed / total_applied) * 100, 1) if total_applied > 0 else 0
-        profile_completion = user.profile_completion if hasattr(user, "profile_completion") else 0
+        # ✅ Gather raw values (same cached stats as the dashboard)
+        stats = get_candidate_stats(user)
+        total_applied = stats["total_applied"]
+        profile_views = stats["profile_views"]
+        interviewed = stats["interviewed"]
+        success_rate = stats["success_rate"]
+        profile_completion = user.profile_completion
 
         raw_values = {
             "total_applied": total_applied,
@@ -604,6 +629,64 @@ class CandidateMilestonesAPIView(APIView):
 
         return Response(data)
     
+class CandidateRecommendationsAPIView(APIView):
+    """
+    Top active jobs for the logged-in candidate, scored in one vectorized
+    pass over every job (skills, role/field terms, years of experience).
+    """
+    permission_classes = [IsAuthenticated]
+    max_limit = 50
+
+    def get(self, request):
+        try:
+            limit = min(max(int(request.query_params.get("limit", 10)), 1), self.max_limit)
+        except ValueError:
+            limit = 10
+
+        ranked = recommend_jobs(request.user, limit=limit)
+
+        # ✅ One query for the winning job cards
+        fields = JobSerializer.Meta.card_fields
+        # The index may predate a job being closed, so re-check is_active on the way out
+        jobs = Job.objects.filter(is_active=True).select_related("company").only(*JobSerializer.get_projection(fields))
+        jobs = jobs.in_bulk([job_id for job_id, _ in ranked])
+        serializer_context = {"request": request}
+
+        return Response([
+            {
+                "score": round(score, 4),
+                "job": JobSerializer(jobs[job_id], fields=fields, context=serializer_context).data,
+            }
+            for job_id, score in ranked if job_id in jobs
+        ])
+
+class CandidateProfileViewAPIView(APIView):
+    """
+    Recruiters report that they opened a candidate's profile.
+    Repeat views are deduped and the rest written in batches, so a view costs no write of its own.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        if not hasattr(request.user, 'company_profile'):
+            return Response({"detail": "Only recruiters can log profile views."}, status=status.HTTP_403_FORBIDDEN)
+        counted = record_profile_view(pk, request.user.pk)
+        return Response({"counted": counted}, status=status.HTTP_202_ACCEPTED)
+
+
+class CandidateProfileViewSeriesAPIView(APIView):
+    """Daily profile views of the logged-in candidate, read from the ProfileViewDaily rollup."""
+    permission_classes = [IsAuthenticated]
+    max_days = 365
+
+    def get(self, request):
+        try:
+            days = min(max(int(request.query_params.get("days", 30)), 1), self.max_days)
+        except ValueError:
+            days = 30
+        return Response(profile_view_series(request.user.pk, days))
+
+
 class UserProfileInfoView(APIView):
     """
     Returns profile info for the logged-in user:
@@ -612,6 +695,7 @@ class UserProfileInfoView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    @conditional_response(profile_info_validator)
     def get(self, request, *args, **kwargs):
         user = request.user
 
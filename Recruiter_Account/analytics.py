@@ -0,0 +1,99 @@
+from django.db import connection
+
+from .models import ApplicationStatusEvent, Job, JobApplication
+
+# Forward stages of the hiring funnel, in order
+FUNNEL_STAGES = ['applied', 'shortlisted', 'interviewed', 'offered']
+
+
+def _seconds_between(later, earlier):
+    if connection.vendor == 'postgresql':
+        return f'EXTRACT(EPOCH FROM ({later} - {earlier}))'
+    if connection.vendor == 'sqlite':
+        return f'(julianday({later}) - julianday({earlier})) * 86400.0'
+    return f'TIMESTAMPDIFF(SECOND, {earlier}, {later})'
+
+
+def _tables():
+    quote = connection.ops.quote_name
+    return {
+        'events': quote(ApplicationStatusEvent._meta.db_table),
+        'applications': quote(JobApplication._meta.db_table),
+        'jobs': quote(Job._meta.db_table),
+    }
+
+
+def stage_reach(company_id):
+    """Applications of the company that ever reached each status, from the event log."""
+    sql = """
+        SELECT e.to_status, COUNT(DISTINCT e.application_id)
+        FROM {events} e
+        JOIN {jobs} j ON j.id = e.job_id
+        WHERE j.company_id = %s
+        GROUP BY e.to_status
+    """.format(**_tables())
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [company_id])
+        return dict(cursor.fetchall())
+
+
+def median_stage_hours(company_id):
+    """
+    Median hours from applying to first reaching each later status.
+
+    The median is taken in SQL: ROW_NUMBER() and COUNT() over each stage
+    pick the middle one or two rows, which are then averaged.
+    """
+    sql = """
+        WITH reached AS (
+            SELECT e.application_id, e.to_status AS stage, MIN(e.changed_at) AS reached_at
+            FROM {events} e
+            JOIN {jobs} j ON j.id = e.job_id
+            WHERE j.company_id = %s AND e.to_status <> 'applied'
+            GROUP BY e.application_id, e.to_status
+        ),
+        durations AS (
+            SELECT r.stage, {seconds} AS seconds
+            FROM reached r
+            JOIN {applications} a ON a.id = r.application_id
+        ),
+        ranked AS (
+            SELECT stage, seconds,
+                   ROW_NUMBER() OVER (PARTITION BY stage ORDER BY seconds) AS position,
+                   COUNT(*) OVER (PARTITION BY stage) AS total
+            FROM durations
+        )
+        SELECT stage, AVG(seconds)
+        FROM ranked
+        WHERE position IN ((total + 1) / 2, (total + 2) / 2)
+        GROUP BY stage
+    """.format(seconds=_seconds_between('r.reached_at', 'a.applied_at'), **_tables())
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [company_id])
+        return {stage: round(float(seconds) / 3600, 1) for stage, seconds in cursor.fetchall()}
+
+
+def hiring_analytics(company_id):
+    reach = stage_reach(company_id)
+    medians = median_stage_hours(company_id)
+    applied = reach.get('applied', 0)
+
+    funnel = []
+    previous = applied
+    for stage in FUNNEL_STAGES:
+        count = reach.get(stage, 0)
+        funnel.append({
+            'stage': stage,
+            'reached': count,
+            # Share of all applicants, and of those who reached the previous stage
+            'conversion': round(count / applied * 100, 1) if applied else 0,
+            'step_conversion': round(count / previous * 100, 1) if previous else 0,
+            'median_hours_from_apply': medians.get(stage),
+        })
+        previous = count
+
+    return {
+        'funnel': funnel,
+        'rejected': reach.get('rejected', 0),
+        'median_hours_to_rejection': medians.get('rejected'),
+    }
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RecruiterAccountConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Recruiter_Account'
+
+    def ready(self):
+        from . import signals  # noqa: F401
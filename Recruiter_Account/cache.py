@@ -0,0 +1,155 @@
+import hashlib
+import time
+
+import redis
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+JOBS_VERSION_KEY = 'jobs:version'
+# Moves when active job content changes (recommendation index)
+JOB_INDEX_VERSION_KEY = 'jobs:index:version'
+# Moves when one company's jobs or their applications change
+COMPANY_VERSION_KEY = 'company:{}:version'
+# Moves when one candidate's applications or profile views change
+CANDIDATE_VERSION_KEY = 'candidate:{}:version'
+
+# How long a rebuilding worker may hold the lock, and how long others wait for it
+LOCK_TIMEOUT = 30
+LOCK_WAIT = 5.0
+LOCK_POLL = 0.05
+
+
+_redis_client = None
+
+
+def get_redis_client():
+    """A redis-py client for REDIS_URL, shared by the buffers that need raw Redis structures."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def _fresh_version():
+    # Time based, so a version key lost to eviction never comes back as an old value
+    return time.time_ns() // 1000
+
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _fresh_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _incr_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _fresh_version(), timeout=None)
+
+
+def _bump_version(key):
+    # Only once the change is committed: bumped earlier, a concurrent reader could rebuild
+    # from the pre-commit rows and cache them under the new version. Immediate in autocommit.
+    transaction.on_commit(lambda: _incr_version(key), robust=True)
+
+
+def get_jobs_version():
+    return _get_version(JOBS_VERSION_KEY)
+
+
+def bump_jobs_version():
+    """Invalidate every cached job response at once."""
+    _bump_version(JOBS_VERSION_KEY)
+
+
+def get_job_index_version():
+    return _get_version(JOB_INDEX_VERSION_KEY)
+
+
+def bump_job_index_version():
+    """Mark the recommendation index stale. Only job edits move it, not applications."""
+    _bump_version(JOB_INDEX_VERSION_KEY)
+
+
+def get_company_version(company_id):
+    return _get_version(COMPANY_VERSION_KEY.format(company_id))
+
+
+def bump_company_version(company_id):
+    """Invalidate cached recruiter views (funnel, stats) for one company."""
+    _bump_version(COMPANY_VERSION_KEY.format(company_id))
+
+
+def get_candidate_version(candidate_id):
+    return _get_version(CANDIDATE_VERSION_KEY.format(candidate_id))
+
+
+def bump_candidate_version(candidate_id):
+    """Invalidate cached candidate views (dashboard stats) for one candidate."""
+    _bump_version(CANDIDATE_VERSION_KEY.format(candidate_id))
+
+
+def request_signature(request, *parts):
+    """Normalized filter parameters plus anything else the payload depends on."""
+    params = sorted(
+        (key, sorted(value for value in values if value))
+        for key, values in request.query_params.lists()
+    )
+    params = [(key, values) for key, values in params if values]
+    # Absolute URLs (logos, pagination links) depend on scheme and host
+    raw = repr((request.scheme, request.get_host(), parts, params))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def single_flight(key, compute, timeout):
+    """
+    Return the cached value for ``key``, computing it at most once at a time.
+
+    On a miss one caller takes a short lock and rebuilds the value while the
+    others poll for it, so an expiry under load costs one query, not hundreds.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    # The rebuilding worker is stuck or gone, don't keep the client waiting
+    return compute()
+
+
+def cached_job_payload(request, scope, compute, *parts):
+    """Cache a job list/detail payload under the current jobs version."""
+    key = f'jobs:{get_jobs_version()}:{scope}:{request_signature(request, *parts)}'
+    return single_flight(key, compute, settings.JOB_CACHE_TIMEOUT)
+
+
+def cached_company_payload(company_id, scope, compute):
+    """Cache a recruiter payload until that company's jobs or applications change."""
+    key = f'company:{company_id}:{get_company_version(company_id)}:{scope}'
+    return single_flight(key, compute, settings.JOB_CACHE_TIMEOUT)
+
+
+def cached_candidate_payload(candidate_id, scope, compute):
+    """Cache a candidate payload until their applications or profile views change."""
+    key = f'candidate:{candidate_id}:{get_candidate_version(candidate_id)}:{scope}'
+    return single_flight(key, compute, settings.JOB_CACHE_TIMEOUT)
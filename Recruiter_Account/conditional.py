@@ -0,0 +1,49 @@
+from django.db.models import Count, Max, Sum
+
+from Account.conditional import make_etag
+from .cache import cached_job_payload
+from .models import Job
+from .stats import get_dashboard_stats, get_recruiter_stats
+
+
+# No Last-Modified on job responses: max(updated_at) stays put when a job is deleted or
+# applications_count moves via .update(), so If-Modified-Since alone would get stale 304s.
+# The ETags are rebuilt under the jobs version, which every such change bumps.
+
+def job_list_validator(view, request, *args, **kwargs):
+    def compute():
+        stats = view.filter_queryset(view.get_queryset()).aggregate(
+            total=Count('id'),
+            updated=Max('updated_at'),
+            company_updated=Max('company__updated_at'),
+            applications=Sum('applications_count'),
+        )
+        return make_etag(request.get_full_path(), *stats.values()), None
+
+    # Cached under the jobs version like the payload, so a 304 costs no query
+    return cached_job_payload(request, 'list-validator', compute)
+
+
+def job_detail_validator(view, request, *args, **kwargs):
+    pk = kwargs.get(view.lookup_field)
+
+    def compute():
+        row = (
+            Job.objects.filter(pk=pk)
+            .values_list('updated_at', 'company__updated_at', 'applications_count')
+            .first()
+        )
+        if row is None:
+            return None, None
+        return make_etag(request.get_full_path(), *row), None
+
+    return cached_job_payload(request, 'detail-validator', compute, pk)
+
+
+def recruiter_stats_validator(view, request, *args, **kwargs):
+    # The stats themselves are cached per company, so a 304 costs no query
+    return make_etag(request.path, request.user.pk, get_recruiter_stats(request.user)), None
+
+
+def recruiter_dashboard_validator(view, request, *args, **kwargs):
+    return make_etag(request.path, request.user.pk, get_dashboard_stats(request.user)), None
@@ -0,0 +1,198 @@
+import threading
+import time
+from collections import Counter
+
+import redis
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .cache import get_redis_client
+from .models import Job, JobViewStats
+
+VIEWS = 'views'
+IMPRESSIONS = 'impressions'
+
+# Rows per multi-row INSERT ... ON CONFLICT statement
+UPSERT_BATCH_SIZE = 500
+
+
+class LocalCounterBuffer:
+    """
+    Per-process counters. Without a shared store a due buffer (old or large
+    enough) is drained by the request that finds it so, and its counts are
+    handed to the write_job_view_counts task; no database write happens on
+    the request.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.last_flush = time.monotonic()
+
+    def add(self, field, job_ids):
+        with self.lock:
+            for job_id in job_ids:
+                self.counts[(field, job_id)] += 1
+            due = (
+                len(self.counts) >= settings.JOB_VIEW_BUFFER_MAX_KEYS
+                or time.monotonic() - self.last_flush >= settings.JOB_VIEW_FLUSH_INTERVAL
+            )
+        if due:
+            self.hand_off()
+
+    def hand_off(self):
+        from .tasks import write_job_view_counts
+
+        counts = self.drain()
+        if not counts:
+            return
+        try:
+            write_job_view_counts.delay(encode_counts(counts))
+        except Exception:
+            self.restore(counts)  # broker unavailable, try again on a later request
+            raise
+
+    def drain(self):
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.last_flush = time.monotonic()
+        return counts
+
+    def commit(self):
+        pass
+
+    def restore(self, counts):
+        with self.lock:
+            self.counts.update(counts)
+
+
+class RedisCounterBuffer:
+    """
+    Counters shared by all processes in one Redis hash, drained by the periodic flush task.
+
+    Draining moves the hash aside and leaves it there until ``commit()``, after
+    the database write. A failed or killed flush is picked up by the next one.
+    """
+    KEY = 'jobs:view-counters'
+    DRAINING_KEY = f'{KEY}:draining'
+    LOCK_KEY = f'{KEY}:flush-lock'
+    LOCK_TIMEOUT = 5 * 60
+
+    def client(self):
+        return get_redis_client()
+
+    def add(self, field, job_ids):
+        pipeline = self.client().pipeline(transaction=False)
+        for job_id in job_ids:
+            pipeline.hincrby(self.KEY, f'{field}:{job_id}', 1)
+        pipeline.execute()
+
+    def drain(self):
+        client = self.client()
+        # One flush at a time, so a pending batch is never written twice
+        if not client.set(self.LOCK_KEY, 1, nx=True, ex=self.LOCK_TIMEOUT):
+            return Counter()
+        # RENAME is atomic: increments after this point go to a fresh hash. A batch left
+        # by an earlier failed flush is written first.
+        if not client.exists(self.DRAINING_KEY):
+            try:
+                client.rename(self.KEY, self.DRAINING_KEY)
+            except redis.ResponseError:  # nothing buffered
+                client.delete(self.LOCK_KEY)
+                return Counter()
+
+        counts = Counter()
+        for key, value in client.hgetall(self.DRAINING_KEY).items():
+            field, job_id = key.decode().split(':')
+            counts[(field, int(job_id))] += int(value)
+        return counts
+
+    def commit(self):
+        self.client().delete(self.DRAINING_KEY, self.LOCK_KEY)
+
+    def restore(self, counts):
+        # The batch stays in DRAINING_KEY for the next flush
+        self.client().delete(self.LOCK_KEY)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_counter_buffer():
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = RedisCounterBuffer() if settings.JOB_VIEW_BUFFER == 'redis' else LocalCounterBuffer()
+        return _buffer
+
+
+def record_job_views(job_ids):
+    if job_ids:
+        get_counter_buffer().add(VIEWS, job_ids)
+
+
+def record_job_impressions(job_ids):
+    if job_ids:
+        get_counter_buffer().add(IMPRESSIONS, job_ids)
+
+
+def encode_counts(counts):
+    """Counts as JSON-friendly ``[field, job_id, value]`` rows, for task arguments."""
+    return [[field, job_id, value] for (field, job_id), value in counts.items()]
+
+
+def decode_counts(rows):
+    return Counter({(field, job_id): value for field, job_id, value in rows})
+
+
+def flush_job_view_counters():
+    """
+    Move buffered counts into JobViewStats. The buffer only lets go of them
+    once the write has committed; on failure they are kept for the next flush.
+    """
+    buffer = get_counter_buffer()
+    counts = buffer.drain()
+    if not counts:
+        return 0
+    try:
+        written = write_counts(counts)
+    except Exception:
+        buffer.restore(counts)
+        raise
+    buffer.commit()
+    return written
+
+
+def write_counts(counts):
+    """
+    Add ``counts`` to the stored totals with multi-row
+    INSERT ... ON CONFLICT DO UPDATE statements, in one transaction.
+    """
+    totals = {}
+    for (field, job_id), value in counts.items():
+        totals.setdefault(job_id, {VIEWS: 0, IMPRESSIONS: 0})[field] += value
+    # Jobs deleted since they were viewed would fail the foreign key
+    existing = set(Job.objects.filter(id__in=totals).values_list('id', flat=True))
+
+    now = timezone.now()
+    rows = [
+        (job_id, total[VIEWS], total[IMPRESSIONS], now)
+        for job_id, total in sorted(totals.items()) if job_id in existing
+    ]
+    table = connection.ops.quote_name(JobViewStats._meta.db_table)
+    with transaction.atomic():
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            batch = rows[start:start + UPSERT_BATCH_SIZE]
+            values = ', '.join(['(%s, %s, %s, %s)'] * len(batch))
+            sql = (
+                f'INSERT INTO {table} (job_id, views, impressions, updated_at) VALUES {values} '
+                f'ON CONFLICT (job_id) DO UPDATE SET '
+                f'views = {table}.views + excluded.views, '
+                f'impressions = {table}.impressions + excluded.impressions, '
+                f'updated_at = excluded.updated_at'
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [value for row in batch for value in row])
+    return len(rows)
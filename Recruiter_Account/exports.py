@@ -0,0 +1,76 @@
+import csv
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+# (header, queryset path) per export; rows are read as plain tuples, never model instances
+JOB_COLUMNS = [
+    ('id', 'id'),
+    ('title', 'title'),
+    ('company', 'company__name'),
+    ('location', 'location'),
+    ('employment_type', 'employment_type'),
+    ('salary_min', 'salary_min'),
+    ('salary_max', 'salary_max'),
+    ('remote_option', 'remote_option'),
+    ('is_active', 'is_active'),
+    ('application_deadline', 'application_deadline'),
+    ('created_at', 'created_at'),
+    ('applications_count', 'applications_count'),
+    ('job_slug', 'job_slug'),
+]
+
+APPLICANT_COLUMNS = [
+    ('id', 'id'),
+    ('job_id', 'job_id'),
+    ('job_title', 'job__title'),
+    ('candidate_id', 'candidate_id'),
+    ('candidate_name', 'candidate__name'),
+    ('candidate_email', 'candidate__email'),
+    ('status', 'status'),
+    ('applied_at', 'applied_at'),
+    ('resume', 'resume'),
+]
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, columns, chunk_size=None):
+    # iterator() streams through a server-side cursor on PostgreSQL
+    paths = [path for _, path in columns]
+    return queryset.order_by('id').values_list(*paths).iterator(
+        chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE
+    )
+
+
+def csv_lines(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(columns, rows):
+    headers = [header for header, _ in columns]
+    for row in rows:
+        yield json.dumps(dict(zip(headers, row)), default=str) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', csv_lines),
+    'ndjson': ('application/x-ndjson', ndjson_lines),
+}
+
+
+def streaming_export(queryset, columns, output, filename):
+    """A download of ``queryset`` that is written out row by row as it is read."""
+    content_type, lines = EXPORT_FORMATS[output]
+    response = StreamingHttpResponse(lines(columns, iter_rows(queryset, columns)), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{output}"'
+    return response
@@ -0,0 +1,72 @@
+from collections import Counter
+
+from django.db.models import Case, CharField, Count, Value, When
+from django.db.models.functions import Coalesce
+
+# (label, lower bound inclusive, upper bound exclusive) over the job's minimum salary
+SALARY_BUCKETS = [
+    ('0-3L', None, 300000),
+    ('3-6L', 300000, 600000),
+    ('6-10L', 600000, 1000000),
+    ('10-20L', 1000000, 2000000),
+    ('20L+', 2000000, None),
+]
+SALARY_UNSPECIFIED = 'unspecified'
+
+FACET_FIELDS = ['employment_type', 'remote_option']
+
+# Locations are grouped by canonical key, so 'Bengaluru' and 'Bangalore, KA' count together
+LOCATION_FIELDS = ['normalized_location_id', 'normalized_location__name']
+
+
+def salary_bucket():
+    salary = Coalesce('salary_min', 'salary_max')
+    whens = []
+    for label, low, high in SALARY_BUCKETS:
+        bounds = {}
+        if low is not None:
+            bounds['salary__gte'] = low
+        if high is not None:
+            bounds['salary__lt'] = high
+        whens.append(When(then=Value(label), **bounds))
+    return salary, Case(*whens, default=Value(SALARY_UNSPECIFIED), output_field=CharField())
+
+
+def compute_facets(queryset):
+    """
+    Counts per canonical location, employment type, remote option and salary bucket
+    for the filtered ``queryset``, from a single GROUP BY over all facet
+    columns. Each facet is then a roll-up of the grouped rows.
+    """
+    salary, bucket = salary_bucket()
+    groups = (
+        queryset.order_by()
+        .annotate(salary=salary, salary_bucket=bucket)
+        .values(*LOCATION_FIELDS, *FACET_FIELDS, 'salary_bucket')
+        .annotate(count=Count('id'))
+    )
+
+    counters = {field: Counter() for field in FACET_FIELDS + ['salary_bucket']}
+    locations = Counter()
+    total = 0
+    for group in groups:
+        total += group['count']
+        locations[tuple(group[field] for field in LOCATION_FIELDS)] += group['count']
+        for field, counter in counters.items():
+            counter[group[field]] += group['count']
+
+    facets = {
+        field: [{'value': value, 'count': count} for value, count in counters[field].most_common()]
+        for field in FACET_FIELDS
+    }
+    facets['location'] = [
+        {'value': key, 'label': name, 'count': count}
+        for (key, name), count in locations.most_common()
+    ]
+    labels = [label for label, _, _ in SALARY_BUCKETS] + [SALARY_UNSPECIFIED]
+    facets['salary'] = [
+        {'value': label, 'count': counters['salary_bucket'][label]}
+        for label in labels if counters['salary_bucket'][label]
+    ]
+    facets['total'] = total
+    return facets
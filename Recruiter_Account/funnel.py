@@ -0,0 +1,42 @@
+from django.db.models import Count
+
+from .models import Job, JobApplication
+
+STATUSES = [value for value, _ in JobApplication.STATUS_CHOICES]
+
+
+def compute_funnel(company):
+    """
+    Applicant counts per status for every job of ``company``.
+
+    One ``GROUP BY job, status`` over a LEFT JOIN from jobs, so jobs without
+    applicants still get a row of zeros. Served by the (job, status) index.
+    """
+    rows = (
+        Job.objects.filter(company=company)
+        .order_by()
+        .values('id', 'title', 'applications__status')
+        .annotate(count=Count('applications__id'))
+    )
+
+    jobs = {}
+    totals = dict.fromkeys(STATUSES, 0)
+    for row in rows:
+        job = jobs.setdefault(row['id'], {
+            'job': row['id'],
+            'title': row['title'],
+            'counts': dict.fromkeys(STATUSES, 0),
+            'total': 0,
+        })
+        status = row['applications__status']
+        if status is None:
+            continue
+        job['counts'][status] = job['counts'].get(status, 0) + row['count']
+        job['total'] += row['count']
+        totals[status] = totals.get(status, 0) + row['count']
+
+    return {
+        'statuses': STATUSES,
+        'jobs': sorted(jobs.values(), key=lambda job: job['job'], reverse=True),
+        'totals': totals,
+    }
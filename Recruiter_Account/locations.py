@@ -0,0 +1,39 @@
+import re
+
+from django.utils.text import slugify
+
+# Spellings that refer to the same place, keyed by their normalized form
+LOCATION_ALIASES = {
+    'bengaluru': 'bangalore',
+    'bangaluru': 'bangalore',
+    'bombay': 'mumbai',
+    'navi mumbai': 'mumbai',
+    'madras': 'chennai',
+    'calcutta': 'kolkata',
+    'gurgaon': 'gurugram',
+    'new delhi': 'delhi',
+    'delhi ncr': 'delhi',
+    'poona': 'pune',
+    'cochin': 'kochi',
+    'trivandrum': 'thiruvananthapuram',
+    'mysore': 'mysuru',
+    'vizag': 'visakhapatnam',
+    'work from home': 'remote',
+    'wfh': 'remote',
+    'anywhere': 'remote',
+}
+
+
+def location_key(text):
+    """
+    Canonical key for a free-text location:
+    'Bengaluru, KA' -> 'bangalore', 'Chennai (Hybrid)' -> 'chennai'.
+    """
+    city = re.split(r'[,(/|]', text or '', maxsplit=1)[0]
+    city = re.sub(r'\s+', ' ', city).strip(' .-').lower()
+    city = LOCATION_ALIASES.get(city, city)
+    return slugify(city)[:100]
+
+
+def location_name(key):
+    return key.replace('-', ' ').title()
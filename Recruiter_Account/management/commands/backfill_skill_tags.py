@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from Account.models import Skill
+from Account.skills import MAX_SKILL_LENGTH, normalize_skill_name, parse_skills, resolve_skill_tags
+from Recruiter_Account.models import Job
+
+
+class Command(BaseCommand):
+    help = "Link jobs and candidate skills to canonical SkillTag rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        jobs = self.backfill_jobs(batch_size)
+        skills = self.backfill_skills(batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Tagged {jobs} jobs and {skills} candidate skills."))
+
+    def backfill_jobs(self, batch_size):
+        Through = Job.skills.through
+        rows = list(Job.objects.order_by('id').values_list('id', 'skills_required'))
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            parsed = {job_id: parse_skills(text) for job_id, text in batch}
+
+            # One tag lookup for the whole batch, then rewrite its link rows
+            names = {}
+            for skills in parsed.values():
+                names.update(skills)
+            tags = resolve_skill_tags(names)
+
+            with transaction.atomic():
+                Through.objects.filter(job_id__in=parsed).delete()
+                Through.objects.bulk_create([
+                    Through(job_id=job_id, skilltag_id=tags[name].id)
+                    for job_id, skills in parsed.items()
+                    for name in skills
+                ])
+        return len(rows)
+
+    def backfill_skills(self, batch_size):
+        pending = list(Skill.objects.filter(tag__isnull=True).order_by('id'))
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            names = {}
+            for skill in batch:
+                normalized = normalize_skill_name(skill.skill_name)
+                if normalized and len(normalized) <= MAX_SKILL_LENGTH:
+                    names.setdefault(normalized, skill.skill_name.strip())
+            tags = resolve_skill_tags(names)
+
+            for skill in batch:
+                skill.tag = tags.get(normalize_skill_name(skill.skill_name))
+            Skill.objects.bulk_update(batch, ['tag'])
+        return len(pending)
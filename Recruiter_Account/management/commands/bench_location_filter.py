@@ -0,0 +1,80 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from Account.models import GoogleUser
+from Recruiter_Account.locations import location_key, location_name
+from Recruiter_Account.models import CompanyProfile, Job, Location
+
+CITIES = [
+    'Bangalore, KA', 'Bengaluru', 'Mumbai', 'Bombay', 'Chennai', 'Hyderabad', 'Pune',
+    'New Delhi', 'Gurgaon', 'Noida', 'Kolkata', 'Kochi', 'Ahmedabad', 'Jaipur', 'Remote',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the job board location filter over synthetic jobs. "
+        "Rows are inserted in a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=1_000_000)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=10)
+        parser.add_argument('--location', action='append', dest='locations',
+                            help="Filter value to time; repeatable. Defaults to an alias and a substring.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.populate(options['jobs'], options['batch_size'])
+            for value in options['locations'] or ['bengaluru', 'hyder']:
+                self.time_filter(value, options['repeat'])
+            transaction.set_rollback(True)
+
+    def populate(self, total, batch_size):
+        recruiter = GoogleUser.objects.create_user(
+            email='bench-location@example.com', name='Bench', user_type='recruiter'
+        )
+        company = CompanyProfile.objects.create(recruiter=recruiter, name='Bench')
+        keys = {city: location_key(city) for city in CITIES}
+        Location.objects.bulk_create(
+            [Location(key=key, name=location_name(key)) for key in set(keys.values())],
+            ignore_conflicts=True,
+        )
+
+        started = time.perf_counter()
+        for offset in range(0, total, batch_size):
+            Job.objects.bulk_create([
+                Job(
+                    company=company, posted_by=recruiter, title=f'Bench job {i}',
+                    location=CITIES[i % len(CITIES)], normalized_location_id=keys[CITIES[i % len(CITIES)]],
+                    job_slug=f'bench-job-{i}',
+                )
+                for i in range(offset, min(offset + batch_size, total))
+            ])
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE "Recruiter_Account_job"')
+        self.stdout.write(f"Inserted {total} jobs in {time.perf_counter() - started:.1f} s")
+
+    def time_filter(self, value, repeat):
+        queryset = Job.objects.filter(
+            Q(normalized_location_id=location_key(value)) | Q(location__icontains=value)
+        ).order_by('-created_at', '-id')
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            count = queryset.count()
+            list(queryset.values_list('id', flat=True)[:20])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        self.stdout.write(
+            f"location={value!r}: {count} matches, "
+            f"median {statistics.median(timings):.1f} ms, max {max(timings):.1f} ms"
+        )
+        self.stdout.write(queryset[:20].explain())
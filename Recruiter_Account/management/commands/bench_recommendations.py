@@ -0,0 +1,107 @@
+import pickle
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from Recruiter_Account.recommendations import JobFeatureIndex
+
+
+class Command(BaseCommand):
+    help = (
+        "Time recommendation scoring over a synthetic index of active jobs. "
+        "With --build, time building the index and loading a published copy instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=100_000)
+        parser.add_argument('--skills', type=int, default=5_000, help="Size of the skill taxonomy.")
+        parser.add_argument('--skills-per-job', type=int, default=8)
+        parser.add_argument('--terms', type=int, default=20_000, help="Size of the title/education vocabulary.")
+        parser.add_argument('--terms-per-job', type=int, default=6)
+        parser.add_argument('--repeat', type=int, default=25)
+        parser.add_argument('--top', type=int, default=10)
+        parser.add_argument('--build', action='store_true', help="Time index builds instead of scoring.")
+        parser.add_argument('--from-db', action='store_true',
+                            help="With --build, time JobFeatureIndex.build() against the configured database.")
+
+    def handle(self, *args, **options):
+        if options['build']:
+            return self.bench_build(options)
+
+        rng = np.random.default_rng(42)
+        n = options['jobs']
+
+        skill_rows = np.repeat(np.arange(n), options['skills_per_job'])
+        term_rows = np.repeat(np.arange(n), options['terms_per_job'])
+        vocabulary = {f'term{i}': i for i in range(options['terms'])}
+        index = JobFeatureIndex(
+            job_ids=np.arange(1, n + 1),
+            skill_rows=skill_rows,
+            skill_ids=rng.integers(0, options['skills'], len(skill_rows)),
+            term_rows=term_rows,
+            term_ids=rng.integers(0, options['terms'], len(term_rows)),
+            min_years=rng.integers(0, 10, n),
+            vocabulary=vocabulary,
+        )
+
+        timings = []
+        for _ in range(options['repeat']):
+            skill_ids = rng.integers(0, options['skills'], 15).tolist()
+            terms = {f'term{i}' for i in rng.integers(0, options['terms'], 6)}
+            applied = np.sort(rng.integers(1, n + 1, 20))
+
+            started = time.perf_counter()
+            scores = index.score(skill_ids, terms, float(rng.integers(0, 12)), exclude_job_ids=applied)
+            index.top_k(scores, options['top'])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        self.report(f"{n} jobs, scoring", timings)
+
+    def bench_build(self, options):
+        """The rebuild task's cost (query + tokenize + arrays) and a worker's cost to adopt the result."""
+        if options['from_db']:
+            build = JobFeatureIndex.build
+        else:
+            rng = np.random.default_rng(42)
+            n = options['jobs']
+            title_terms = rng.integers(0, options['terms'], (n, max(options['terms_per_job'] - 2, 1))).tolist()
+            education_terms = rng.integers(0, options['terms'], (n, 2)).tolist()
+            jobs = [
+                (
+                    job_id,
+                    ' '.join(f'term{i}' for i in title_terms[job_id - 1]),
+                    ' '.join(f'term{i}' for i in education_terms[job_id - 1]),
+                    f'{job_id % 10}-{job_id % 10 + 2} years',
+                )
+                for job_id in range(1, n + 1)
+            ]
+            tags = rng.integers(0, options['skills'], (n, options['skills_per_job'])).tolist()
+            links = [(job_id, tag_id) for job_id in range(1, n + 1) for tag_id in tags[job_id - 1]]
+
+            def build():
+                return JobFeatureIndex.from_rows(jobs, links)
+
+        builds, loads = [], []
+        for _ in range(options['repeat']):
+            started = time.perf_counter()
+            index = build()
+            builds.append((time.perf_counter() - started) * 1000)
+
+            payload = pickle.dumps(index)
+            started = time.perf_counter()
+            pickle.loads(payload)
+            loads.append((time.perf_counter() - started) * 1000)
+
+        self.report(f"{len(index)} jobs, build", builds)
+        self.report(f"{len(index)} jobs, load published copy ({len(payload) / 1e6:.1f} MB)", loads)
+
+    def report(self, label, timings):
+        timings.sort()
+        self.stdout.write(
+            f"{label}, {len(timings)} runs: "
+            f"median {statistics.median(timings):.1f} ms, "
+            f"p95 {timings[max(int(len(timings) * 0.95) - 1, 0)]:.1f} ms, "
+            f"max {timings[-1]:.1f} ms"
+        )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from Recruiter_Account.exports import EXPORT_FORMATS, JOB_COLUMNS, iter_rows
+from Recruiter_Account.models import Job
+
+
+class Command(BaseCommand):
+    help = "Dump jobs as CSV or NDJSON, streamed with constant memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', choices=sorted(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--file', help="Destination path; defaults to stdout.")
+        parser.add_argument('--active-only', action='store_true')
+        parser.add_argument('--chunk-size', type=int, default=None)
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.all()
+        if options['active_only']:
+            jobs = jobs.filter(is_active=True)
+
+        _, lines = EXPORT_FORMATS[options['output']]
+        rows = iter_rows(jobs, JOB_COLUMNS, options['chunk_size'])
+        if not options['file']:
+            for line in lines(JOB_COLUMNS, rows):
+                self.stdout.write(line, ending='')
+            return
+
+        with open(options['file'], 'w', newline='') as destination:
+            destination.writelines(lines(JOB_COLUMNS, rows))
+        self.stderr.write(self.style.SUCCESS(f"Exported jobs to {options['file']}."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from Recruiter_Account.models import Job
+from Recruiter_Account.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search document for every job."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        batch_size = options['batch_size']
+        ids = list(Job.objects.order_by('id').values_list('id', flat=True))
+
+        for start in range(0, len(ids), batch_size):
+            backend.index(ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {len(ids)} jobs."))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from Recruiter_Account.cache import bump_jobs_version
+from Recruiter_Account.models import Job, JobApplication
+
+
+def actual_applications_count():
+    counts = (
+        JobApplication.objects.filter(job=OuterRef('pk'))
+        .order_by()
+        .values('job')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class Command(BaseCommand):
+    help = "Repair Job.applications_count wherever it drifted from the applications table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        drifted = list(
+            Job.objects.annotate(actual=actual_applications_count())
+            .exclude(applications_count=F('actual'))
+            .values_list('id', flat=True)
+        )
+
+        if options['dry_run']:
+            self.stdout.write(f"{len(drifted)} jobs have a drifted applications_count.")
+            return
+
+        for start in range(0, len(drifted), batch_size):
+            with transaction.atomic():
+                Job.objects.filter(pk__in=drifted[start:start + batch_size]).update(
+                    applications_count=actual_applications_count()
+                )
+
+        if drifted:
+            bump_jobs_version()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {len(drifted)} jobs."))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0005_remove_jobapplication_cover_letter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at', '-id'], name='job_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['-applied_at', '-id'], name='application_applied_id_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:24
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+FTS_TABLE = 'recruiter_account_job_fts'
+
+POSTGRES_DOCUMENT = """
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(skills_required, '')), 'B') ||
+    setweight(to_tsvector('english',
+        coalesce(about_job, '') || ' ' ||
+        coalesce(key_responsibilities, '') || ' ' ||
+        coalesce(qualifications, '')), 'C')
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX job_search_document_gin ON "Recruiter_Account_job" USING gin (search_document)'
+        )
+        schema_editor.execute(f'UPDATE "Recruiter_Account_job" SET search_document = {POSTGRES_DOCUMENT}')
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(title, skills, body, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, skills, body) "
+            f"SELECT id, title, skills_required, "
+            f"about_job || ' ' || key_responsibilities || ' ' || qualifications "
+            f'FROM "Recruiter_Account_job"'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS job_search_document_gin')
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0006_job_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_document',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
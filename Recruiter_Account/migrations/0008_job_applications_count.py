@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:26
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_applications_count(apps, schema_editor):
+    Job = apps.get_model('Recruiter_Account', 'Job')
+    JobApplication = apps.get_model('Recruiter_Account', 'JobApplication')
+    counts = (
+        JobApplication.objects.filter(job=OuterRef('pk'))
+        .order_by()
+        .values('job')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Job.objects.update(applications_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0007_job_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='applications_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_applications_count, migrations.RunPython.noop),
+    ]
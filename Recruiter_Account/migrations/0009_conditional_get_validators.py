@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:31
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_updated_at(apps, schema_editor):
+    JobApplication = apps.get_model('Recruiter_Account', 'JobApplication')
+    JobApplication.objects.update(updated_at=F('applied_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0008_job_applications_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0012_skill_tags'),
+        ('Recruiter_Account', '0009_conditional_get_validators'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='jobs', to='Account.skilltag'),
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:34
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+# Frozen copy of Recruiter_Account.locations as of this migration, so later
+# changes to the runtime aliases don't change what the backfill produces
+LOCATION_ALIASES = {
+    'bengaluru': 'bangalore',
+    'bangaluru': 'bangalore',
+    'bombay': 'mumbai',
+    'navi mumbai': 'mumbai',
+    'madras': 'chennai',
+    'calcutta': 'kolkata',
+    'gurgaon': 'gurugram',
+    'new delhi': 'delhi',
+    'delhi ncr': 'delhi',
+    'poona': 'pune',
+    'cochin': 'kochi',
+    'trivandrum': 'thiruvananthapuram',
+    'mysore': 'mysuru',
+    'vizag': 'visakhapatnam',
+    'work from home': 'remote',
+    'wfh': 'remote',
+    'anywhere': 'remote',
+}
+
+
+def location_key(text):
+    city = re.split(r'[,(/|]', text or '', maxsplit=1)[0]
+    city = re.sub(r'\s+', ' ', city).strip(' .-').lower()
+    city = LOCATION_ALIASES.get(city, city)
+    return slugify(city)[:100]
+
+
+def location_name(key):
+    return key.replace('-', ' ').title()
+
+
+def backfill_locations(apps, schema_editor):
+    Location = apps.get_model('Recruiter_Account', 'Location')
+    keys = {}
+    for model_name in ('Job', 'CompanyProfile'):
+        model = apps.get_model('Recruiter_Account', model_name)
+        for location in model.objects.exclude(location__isnull=True).values_list('location', flat=True).distinct():
+            key = location_key(location)
+            if key:
+                keys.setdefault(key, []).append((model, location))
+
+    Location.objects.bulk_create(
+        [Location(key=key, name=location_name(key)) for key in keys], ignore_conflicts=True
+    )
+    for key, rows in keys.items():
+        for model, location in rows:
+            model.objects.filter(location=location).update(normalized_location_id=key)
+
+
+def create_trigram_index(apps, schema_editor):
+    # icontains compiles to UPPER("location"::text) LIKE UPPER(...) on PostgreSQL,
+    # so the trigram index is built over that exact expression
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(
+            'CREATE INDEX job_location_trgm ON "Recruiter_Account_job" '
+            'USING gin (UPPER("location"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS job_location_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0010_job_skill_tags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.SlugField(max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='companyprofile',
+            name='normalized_location',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='companies', to='Recruiter_Account.location', to_field='key'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='normalized_location',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='Recruiter_Account.location', to_field='key'),
+        ),
+        migrations.RunPython(backfill_locations, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
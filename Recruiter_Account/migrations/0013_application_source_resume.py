@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def link_resumes(apps, schema_editor):
+    JobApplication = apps.get_model('Recruiter_Account', 'JobApplication')
+    Resume = apps.get_model('Account', 'Resume')
+    JobApplication.objects.exclude(resume='').exclude(resume__isnull=True).update(
+        source_resume=Subquery(
+            Resume.objects.filter(candidate=OuterRef('candidate'), file=OuterRef('resume')).values('id')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0012_skill_tags'),
+        ('Recruiter_Account', '0012_job_active_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='source_resume',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='applications', to='Account.resume'),
+        ),
+        migrations.RunPython(link_resumes, migrations.RunPython.noop),
+    ]
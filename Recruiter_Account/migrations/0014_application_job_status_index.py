@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0012_skill_tags'),
+        ('Recruiter_Account', '0013_application_source_resume'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', 'status'], name='application_job_status_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:43
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def create_changed_at_index(apps, schema_editor):
+    table = schema_editor.quote_name(apps.get_model('Recruiter_Account', 'ApplicationStatusEvent')._meta.db_table)
+    # Events are only ever appended, so changed_at follows the physical order and a BRIN index stays tiny
+    method = 'USING brin ' if schema_editor.connection.vendor == 'postgresql' else ''
+    schema_editor.execute(f'CREATE INDEX status_event_changed_at_idx ON {table} {method}(changed_at)')
+
+
+def drop_changed_at_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS status_event_changed_at_idx')
+
+
+def backfill_events(apps, schema_editor):
+    # History before this table existed: the application itself, then its current status
+    Event = apps.get_model('Recruiter_Account', 'ApplicationStatusEvent')
+    JobApplication = apps.get_model('Recruiter_Account', 'JobApplication')
+    events = schema_editor.quote_name(Event._meta.db_table)
+    applications = schema_editor.quote_name(JobApplication._meta.db_table)
+    columns = '(application_id, job_id, from_status, to_status, changed_at)'
+    schema_editor.execute(
+        f"INSERT INTO {events} {columns} "
+        f"SELECT id, job_id, '', 'applied', applied_at FROM {applications}"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {events} {columns} "
+        f"SELECT id, job_id, 'applied', status, updated_at FROM {applications} WHERE status <> 'applied'"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0014_application_job_status_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, max_length=50)),
+                ('to_status', models.CharField(choices=[('applied', 'Applied'), ('shortlisted', 'Shortlisted'), ('interviewed', 'Interviewed'), ('offered', 'Offered'), ('rejected', 'Rejected')], max_length=50)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('application', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='Recruiter_Account.jobapplication')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='Recruiter_Account.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['application', 'changed_at'], name='status_event_application_idx')],
+            },
+        ),
+        migrations.RunPython(create_changed_at_index, drop_changed_at_index),
+        migrations.RunPython(backfill_events, migrations.RunPython.noop),
+    ]
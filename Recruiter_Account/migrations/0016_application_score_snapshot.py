@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:45
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_resume_scores(apps, schema_editor):
+    JobApplication = apps.get_model('Recruiter_Account', 'JobApplication')
+    Resume = apps.get_model('Account', 'Resume')
+    resume = Resume.objects.filter(pk=OuterRef('source_resume'))
+    JobApplication.objects.filter(source_resume__isnull=False).update(
+        ats_score=Subquery(resume.values('ats_score')[:1]),
+        hire_chance=Subquery(resume.values('hire_chance')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0012_skill_tags'),
+        ('Recruiter_Account', '0015_application_status_events'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='ats_score',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='hire_chance',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(copy_resume_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-ats_score', '-id'], name='application_job_score_idx'),
+        ),
+    ]
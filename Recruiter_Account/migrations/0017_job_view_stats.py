@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Recruiter_Account', '0016_application_score_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobViewStats',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='view_stats', serialize=False, to='Recruiter_Account.job')),
+                ('views', models.BigIntegerField(default=0)),
+                ('impressions', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
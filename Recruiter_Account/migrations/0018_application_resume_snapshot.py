@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:30
+
+from django.db import migrations
+from django.db.models import OuterRef, Q, Subquery
+
+
+def copy_resume_files(apps, schema_editor):
+    # Best effort for older rows: the linked Resume's current file
+    JobApplication = apps.get_model('Recruiter_Account', 'JobApplication')
+    Resume = apps.get_model('Account', 'Resume')
+    JobApplication.objects.filter(Q(resume='') | Q(resume__isnull=True), source_resume__isnull=False).update(
+        resume=Subquery(Resume.objects.filter(pk=OuterRef('source_resume')).values('file')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Account', '0012_skill_tags'),
+        ('Recruiter_Account', '0017_job_view_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_resume_files, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,21 @@
 # recruiter/models.py
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from Account.models import GoogleUser  # assuming you already have this
 
 from django.conf import settings
 
+class Location(models.Model):
+    """Canonical location shared by jobs and companies (see Recruiter_Account.locations)."""
+    key = models.SlugField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+
+    def __str__(self):
+        return self.name
+
+
 class CompanyProfile(models.Model):
     recruiter = models.OneToOneField(
         settings.AUTH_USER_MODEL,
@@ -30,6 +41,10 @@ class CompanyProfile(models.Model):
         null=True
     )
     location = models.CharField(max_length=255, blank=True, null=True)
+    normalized_location = models.ForeignKey(
+        'Location', to_field='key', on_delete=models.SET_NULL, null=True, blank=True,
+        editable=False, related_name='companies'
+    )
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
@@ -43,6 +58,10 @@ class Job(models.Model):
 
     title = models.CharField(max_length=200)
     location = models.CharField(max_length=200)
+    normalized_location = models.ForeignKey(
+        'Location', to_field='key', on_delete=models.SET_NULL, null=True, blank=True,
+        editable=False, related_name='jobs'
+    )
     employment_type = models.CharField(
         max_length=50,
         choices=[
@@ -58,6 +77,8 @@ class Job(models.Model):
     salary_max = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     experience_required = models.CharField(max_length=100, blank=True)
     skills_required = models.TextField(blank=True)
+    # Canonical tags parsed from skills_required on save
+    skills = models.ManyToManyField('Account.SkillTag', blank=True, related_name='jobs')
     education_required = models.CharField(max_length=200, blank=True)
 
     job_type = models.CharField(max_length=50, blank=True)
@@ -73,35 +94,116 @@ class Job(models.Model):
     qualifications = models.TextField(blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     is_active = models.BooleanField(default=True)
     job_slug = models.SlugField(max_length=250, unique=True, blank=True)
 
+    # Denormalized, kept in step with JobApplication inserts/deletes by signals
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Weighted full-text document, maintained by Recruiter_Account.search
+    search_document = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination seeks on (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='job_created_id_idx'),
+            # The default listing only reads live jobs; expired rows stay out of its index
+            models.Index(
+                fields=['-created_at', '-id'], name='job_active_created_idx',
+                condition=models.Q(is_active=True),
+            ),
+            # Expiry sweep: active jobs by deadline
+            models.Index(
+                fields=['application_deadline'], name='job_active_deadline_idx',
+                condition=models.Q(is_active=True),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company.name}"
 
 
 
 class JobApplication(models.Model):
+    STATUS_CHOICES = [
+        ('applied', 'Applied'),
+        ('shortlisted', 'Shortlisted'),
+        ('interviewed', 'Interviewed'),
+        ('offered', 'Offered'),
+        ('rejected', 'Rejected'),
+    ]
+
     job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='applications')
     candidate = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='job_applications')
+    # The file applied with (a path, not a copy). Re-uploads overwrite the Resume row in place,
+    # so source_resume only says which upload slot it came from
     resume = models.FileField(upload_to='resumes/', null=True, blank=True)
-    applied_at = models.DateTimeField(auto_now_add=True)
-    status = models.CharField(
-        max_length=50,
-        choices=[
-            ('applied', 'Applied'),
-            ('shortlisted', 'Shortlisted'),
-            ('interviewed', 'Interviewed'),
-            ('offered', 'Offered'),
-            ('rejected', 'Rejected'),
-        ],
-        default='applied'
+    source_resume = models.ForeignKey(
+        'Account.Resume', on_delete=models.SET_NULL, null=True, blank=True,
+        editable=False, related_name='applications'
     )
+    # Resume analysis at the time of applying, copied so applicants can be ranked by index
+    ats_score = models.IntegerField(default=0, editable=False)
+    hire_chance = models.IntegerField(default=0, editable=False)
+    applied_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    status = models.CharField(max_length=50, choices=STATUS_CHOICES, default='applied')
 
     class Meta:
         unique_together = ('job', 'candidate')  # Prevent duplicate applications
+        indexes = [
+            # Keyset pagination seeks on (applied_at, id)
+            models.Index(fields=['-applied_at', '-id'], name='application_applied_id_idx'),
+            # Per-job status counts (funnel) read only this index
+            models.Index(fields=['job', 'status'], name='application_job_status_idx'),
+            # ?job=..&ordering=-ats_score reads the top of this index
+            models.Index(fields=['job', '-ats_score', '-id'], name='application_job_score_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status as loaded, so the next save can log the transition
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Keeps the post_save counter update in the same transaction as the insert
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.candidate.email} - {self.job.title}"
 
+
+class ApplicationStatusEvent(models.Model):
+    """Append-only history of status transitions, written with the change itself."""
+    # Covered by status_event_application_idx
+    application = models.ForeignKey(
+        'JobApplication', on_delete=models.CASCADE, related_name='status_events', db_index=False
+    )
+    job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='status_events')
+    from_status = models.CharField(max_length=50, blank=True)
+    to_status = models.CharField(max_length=50, choices=JobApplication.STATUS_CHOICES)
+    # Indexed by the migration: BRIN on PostgreSQL (rows arrive in time order), B-tree elsewhere
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['application', 'changed_at'], name='status_event_application_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class JobViewStats(models.Model):
+    """Detail views and list impressions per job, flushed in batches from Recruiter_Account.counters."""
+    job = models.OneToOneField('Job', on_delete=models.CASCADE, primary_key=True, related_name='view_stats')
+    views = models.BigIntegerField(default=0)
+    impressions = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.job_id}: {self.views} views, {self.impressions} impressions"
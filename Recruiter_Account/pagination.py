@@ -0,0 +1,161 @@
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination that seeks on every ordering column, not just the first.
+
+    The cursor stores the full ordering key of the boundary row (e.g.
+    ``[created_at, id]``), so each page is a plain index range scan:
+    deep pages cost the same as the first one and rows inserted while a
+    client is paging never shift the pages it has not fetched yet.
+    The last ordering column must be unique (normally ``id``).
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.cursor.position if self.cursor else None
+
+        ordering = reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(seek_filter(ordering, self.decode_position(position, queryset)))
+
+        # Fetch one extra row to find out whether another page follows
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        if self.page:
+            self.previous_position = self._get_position_from_instance(self.page[0], self.ordering)
+            self.next_position = self._get_position_from_instance(self.page[-1], self.ordering)
+        else:
+            self.previous_position = self.next_position = position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self.next_position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self.previous_position))
+
+    def decode_position(self, position, queryset):
+        """The cursor's key values, each converted by its ordering field; tampered cursors are a 404."""
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            values = [
+                ordering_field(queryset, field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if any(value is None for value in values):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            # Keep full microsecond precision, ties are resolved on the next column
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            values.append(value)
+        return json.dumps(values)
+
+
+class JobCursorPagination(KeysetCursorPagination):
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        # Full-text results are paged by relevance instead of recency
+        if 'search_rank' in queryset.query.annotations:
+            return ('-search_rank', '-id')
+        return super().get_ordering(request, queryset, view)
+
+
+class JobApplicationCursorPagination(KeysetCursorPagination):
+    ordering = ('-applied_at', '-id')
+    # ?ordering= values, each ending on the unique id for the keyset
+    orderings = {
+        '-applied_at': ('-applied_at', '-id'),
+        'applied_at': ('applied_at', 'id'),
+        '-ats_score': ('-ats_score', '-id'),
+        'ats_score': ('ats_score', 'id'),
+    }
+
+    def get_ordering(self, request, queryset, view):
+        return self.orderings.get(request.query_params.get('ordering'), self.ordering)
+
+
+def ordering_field(queryset, name):
+    """Model field or annotation (e.g. ``search_rank``) behind an ordering column."""
+    if name in queryset.query.annotations:
+        return queryset.query.annotations[name].output_field
+    try:
+        return queryset.model._meta.get_field(name)
+    except FieldDoesNotExist:
+        raise ValueError(name)
+
+
+def reverse_ordering(ordering):
+    return tuple(field[1:] if field.startswith('-') else '-' + field for field in ordering)
+
+
+def seek_filter(ordering, values):
+    """
+    Build ``(a, b) > (x, y)`` in terms of ``ordering`` as an OR of prefixes:
+    ``a > x OR (a = x AND b > y)``. The leading bound is repeated as a plain
+    range so the planner can drive the scan from the composite index.
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        term = Q(**{f'{name}__{lookup}': values[i]})
+        for prev_field, prev_value in zip(ordering[:i], values[:i]):
+            term &= Q(**{prev_field.lstrip('-'): prev_value})
+        condition |= term
+
+    lead = ordering[0]
+    lead_lookup = 'lte' if lead.startswith('-') else 'gte'
+    return Q(**{f'{lead.lstrip("-")}__{lead_lookup}': values[0]}) & condition
@@ -0,0 +1,205 @@
+import re
+import threading
+
+import numpy as np
+from django.core.cache import cache
+
+from .cache import get_job_index_version
+from .models import Job
+
+# Relative weight of each signal in the final score
+WEIGHTS = {'skills': 0.6, 'terms': 0.25, 'experience': 0.15}
+
+STOP_WORDS = {'a', 'an', 'and', 'the', 'of', 'in', 'for', 'with', 'to', 'on', 'or', 'at'}
+
+
+def tokenize(text):
+    return {term for term in re.findall(r'[a-z0-9+#]+', (text or '').lower()) if term not in STOP_WORDS}
+
+
+def parse_min_years(text):
+    """'2-4 years' -> 2.0, 'Fresher' -> 0.0"""
+    match = re.search(r'\d+(?:\.\d+)?', text or '')
+    return float(match.group()) if match else 0.0
+
+
+class JobFeatureIndex:
+    """
+    Sparse features of every active job, held as flat NumPy arrays.
+
+    Skills and title/education terms are stored in COO form (one
+    ``(row, id)`` pair per non-zero), so scoring a candidate is a
+    bit-vector lookup plus a ``bincount`` over all jobs at once.
+    """
+
+    def __init__(self, job_ids, skill_rows, skill_ids, term_rows, term_ids, min_years, vocabulary):
+        self.job_ids = np.asarray(job_ids, dtype=np.int64)
+        self.skill_rows = np.asarray(skill_rows, dtype=np.int64)
+        self.skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        self.term_rows = np.asarray(term_rows, dtype=np.int64)
+        self.term_ids = np.asarray(term_ids, dtype=np.int64)
+        self.min_years = np.asarray(min_years, dtype=np.float64)
+        self.vocabulary = vocabulary
+
+        n = len(self.job_ids)
+        self.skill_counts = np.maximum(np.bincount(self.skill_rows, minlength=n), 1)
+        self.term_counts = np.maximum(np.bincount(self.term_rows, minlength=n), 1)
+        self.skill_space = int(self.skill_ids.max()) + 1 if len(self.skill_ids) else 1
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    @classmethod
+    def build(cls):
+        jobs = list(
+            Job.objects.filter(is_active=True)
+            .order_by('id')
+            .values_list('id', 'title', 'education_required', 'experience_required')
+        )
+        links = list(
+            Job.skills.through.objects.filter(job__is_active=True)
+            .values_list('job_id', 'skilltag_id')
+        )
+        return cls.from_rows(jobs, links)
+
+    @classmethod
+    def from_rows(cls, jobs, links):
+        """``jobs`` as ``(id, title, education, experience)`` sorted by id, ``links`` as ``(job_id, tag_id)``."""
+        job_ids = np.array([job[0] for job in jobs], dtype=np.int64)
+        links = np.array(links, dtype=np.int64).reshape(-1, 2)
+        skill_rows = np.searchsorted(job_ids, links[:, 0])
+        # The links are a separate read: drop any whose job is not in ``jobs`` (activated or
+        # closed in between) instead of crediting its skills to a neighbouring row
+        known = skill_rows < len(job_ids)
+        known[known] = job_ids[skill_rows[known]] == links[known, 0]
+        skill_rows, links = skill_rows[known], links[known]
+
+        vocabulary = {}
+        term_rows, term_ids = [], []
+        for row, (_, title, education, _) in enumerate(jobs):
+            for term in tokenize(title) | tokenize(education):
+                term_rows.append(row)
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+
+        min_years = [parse_min_years(job[3]) for job in jobs]
+        return cls(job_ids, skill_rows, links[:, 1], term_rows, term_ids, min_years, vocabulary)
+
+    def score(self, skill_ids, terms, years, exclude_job_ids=()):
+        n = len(self)
+
+        skill_mask = np.zeros(self.skill_space, dtype=bool)
+        skill_ids = np.asarray([s for s in skill_ids if s < self.skill_space], dtype=np.int64)
+        skill_mask[skill_ids] = True
+        skill_hits = np.bincount(self.skill_rows[skill_mask[self.skill_ids]], minlength=n)
+
+        term_mask = np.zeros(max(len(self.vocabulary), 1), dtype=bool)
+        term_mask[[self.vocabulary[t] for t in terms if t in self.vocabulary]] = True
+        term_hits = np.bincount(self.term_rows[term_mask[self.term_ids]], minlength=n)
+
+        # Meeting the minimum years scores 1, falling short scales linearly
+        required = self.min_years
+        with np.errstate(divide='ignore', invalid='ignore'):
+            experience = np.where(required > 0, np.minimum(years / required, 1.0), 1.0)
+
+        scores = (
+            WEIGHTS['skills'] * skill_hits / self.skill_counts
+            + WEIGHTS['terms'] * term_hits / self.term_counts
+            + WEIGHTS['experience'] * experience
+        )
+
+        if len(exclude_job_ids):
+            excluded = np.asarray(list(exclude_job_ids), dtype=np.int64)
+            positions = np.searchsorted(self.job_ids, excluded)
+            found = positions < n
+            positions, excluded = positions[found], excluded[found]
+            scores[positions[self.job_ids[positions] == excluded]] = -np.inf
+        return scores
+
+    def top_k(self, scores, k):
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(int(self.job_ids[i]), float(scores[i])) for i in best if np.isfinite(scores[i])]
+
+
+# Shared across processes: the index built by the rebuild task, and the index version it reflects
+INDEX_KEY = 'recommendations:index'
+INDEX_BUILT_KEY = 'recommendations:index:built'
+REBUILD_CLAIM_TIMEOUT = 10 * 60
+
+_index_lock = threading.Lock()
+_index_state = {'version': None, 'index': None}
+
+
+def rebuild_shared_index():
+    """Build the index from the database and publish it for every worker. Returns ``(version, index)``."""
+    # Read first: an edit during the build leaves the published copy marked stale
+    version = get_job_index_version()
+    index = JobFeatureIndex.build()
+    cache.set(INDEX_KEY, (version, index), timeout=None)
+    cache.set(INDEX_BUILT_KEY, version, timeout=None)
+    return version, index
+
+
+def shared_index_is_stale():
+    return cache.get(INDEX_BUILT_KEY) != get_job_index_version()
+
+
+def request_index_rebuild(version):
+    """Queue one rebuild per index version, however many workers notice it is stale."""
+    from .tasks import rebuild_recommendation_index
+
+    if cache.add(f'{INDEX_KEY}:rebuild:{version}', 1, timeout=REBUILD_CLAIM_TIMEOUT):
+        rebuild_recommendation_index.delay()
+
+
+def get_job_index():
+    """
+    The process-wide index, a copy of the one published by the rebuild task.
+
+    Requests never rebuild it themselves: when job edits moved the index
+    version on, a rebuild is queued and the previous index keeps serving
+    until the new one is published. The payload is only fetched from the
+    cache when a newer build exists. Only a cold start with nothing
+    published yet builds inline.
+    """
+    current, built = get_job_index_version(), cache.get(INDEX_BUILT_KEY)
+    if built != current:
+        request_index_rebuild(current)
+        built = cache.get(INDEX_BUILT_KEY)  # already published if the task ran eagerly
+
+    if _index_state['index'] is not None and _index_state['version'] == built:
+        return _index_state['index']
+
+    with _index_lock:
+        if _index_state['index'] is None or _index_state['version'] != built:
+            # Cold start: nothing published yet, so this one request builds it
+            shared = cache.get(INDEX_KEY) or rebuild_shared_index()
+            _index_state['version'], _index_state['index'] = shared
+        return _index_state['index']
+
+
+def candidate_profile(user):
+    """Skill tag ids, role/field terms and total years of experience for a candidate."""
+    skill_ids = list(user.skill.filter(tag__isnull=False).values_list('tag_id', flat=True))
+
+    terms = tokenize(user.job_role)
+    years = 0
+    for position, start, end in user.experience.values_list('position_name', 'start_year', 'end_year'):
+        terms |= tokenize(position)
+        years += max(end - start, 0)
+    for field_name in user.education.values_list('field_name', flat=True):
+        terms |= tokenize(field_name)
+
+    return skill_ids, terms, float(years)
+
+
+def recommend_jobs(user, limit=10):
+    """Top ``limit`` ``(job_id, score)`` pairs for ``user``, skipping jobs already applied to."""
+    index = get_job_index()
+    skill_ids, terms, years = candidate_profile(user)
+    applied = user.job_applications.values_list('job_id', flat=True)
+    scores = index.score(skill_ids, terms, years, exclude_job_ids=sorted(applied))
+    return index.top_k(scores, limit)
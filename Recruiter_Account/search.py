@@ -0,0 +1,138 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Job
+
+# Text search configuration used for the PostgreSQL tsvector column
+SEARCH_CONFIG = 'english'
+
+# SQLite FTS5 shadow table, one row per job keyed by rowid = job.id
+FTS_TABLE = 'recruiter_account_job_fts'
+
+# bm25() column weights for (title, skills, body), mirroring tsvector A/B/C
+FTS_WEIGHTS = (10.0, 4.0, 1.0)
+
+BODY_FIELDS = ('about_job', 'key_responsibilities', 'qualifications')
+
+
+class PostgresJobSearchBackend:
+    """Weighted tsvector stored on Job.search_document, backed by a GIN index."""
+
+    def document(self):
+        return (
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('skills_required', weight='B', config=SEARCH_CONFIG)
+            + SearchVector(*BODY_FIELDS, weight='C', config=SEARCH_CONFIG)
+        )
+
+    def index(self, job_ids):
+        Job.objects.filter(pk__in=job_ids).update(search_document=self.document())
+
+    def remove(self, job_ids):
+        # The document lives on the job row itself
+        pass
+
+    def search(self, queryset, text):
+        query = SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+        # float8 so the rank survives a round trip through the pagination cursor
+        rank = Cast(SearchRank(F('search_document'), query), FloatField())
+        return queryset.filter(search_document=query).annotate(search_rank=rank)
+
+
+class SqliteJobSearchBackend:
+    """FTS5 shadow table for local and test runs."""
+
+    def index(self, job_ids):
+        rows = Job.objects.filter(pk__in=job_ids).values_list(
+            'id', 'title', 'skills_required', *BODY_FIELDS
+        )
+        with connection.cursor() as cursor:
+            self._delete(cursor, job_ids)
+            cursor.executemany(
+                f'INSERT INTO {FTS_TABLE} (rowid, title, skills, body) VALUES (%s, %s, %s, %s)',
+                [(pk, title, skills, ' '.join(body)) for pk, title, skills, *body in rows],
+            )
+
+    def remove(self, job_ids):
+        with connection.cursor() as cursor:
+            self._delete(cursor, job_ids)
+
+    def search(self, queryset, text):
+        match = fts5_query(text)
+        if not match:
+            return queryset.none()
+
+        job_table = connection.ops.quote_name(Job._meta.db_table)
+        weights = ', '.join(str(w) for w in FTS_WEIGHTS)
+        # bm25() is "lower is better"; negate it so both backends sort rank DESC
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = {job_table}.id',
+            [match],
+            output_field=FloatField(),
+        )
+        matches = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+        return queryset.filter(id__in=matches).annotate(search_rank=rank)
+
+    def _delete(self, cursor, job_ids):
+        job_ids = list(job_ids)
+        if job_ids:
+            placeholders = ', '.join(['%s'] * len(job_ids))
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})', job_ids)
+
+
+class BasicJobSearchBackend:
+    """Unindexed fallback for other databases: substring match, no ranking."""
+
+    def index(self, job_ids):
+        pass
+
+    def remove(self, job_ids):
+        pass
+
+    def search(self, queryset, text):
+        condition = Q()
+        for field in ('title', 'skills_required') + BODY_FIELDS:
+            condition |= Q(**{f'{field}__icontains': text})
+        return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def get_search_backend():
+    if connection.vendor == 'postgresql':
+        return PostgresJobSearchBackend()
+    if connection.vendor == 'sqlite':
+        return SqliteJobSearchBackend()
+    return BasicJobSearchBackend()
+
+
+def fts5_query(text):
+    """Turn free text into an FTS5 query: every term required, prefix matched."""
+    terms = re.findall(r'\w+', text.lower())
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+class JobSearchFilter(BaseFilterBackend):
+    """
+    Ranked full-text search over jobs via ``?q=`` (``?search=`` is still accepted).
+    Matching rows are annotated with ``search_rank``.
+    """
+    search_params = ('q', 'search')
+
+    def get_search_text(self, request):
+        for param in self.search_params:
+            text = request.query_params.get(param, '').strip()
+            if text:
+                return text
+        return ''
+
+    def filter_queryset(self, request, queryset, view):
+        text = self.get_search_text(request)
+        if not text:
+            return queryset
+        return get_search_backend().search(queryset, text)
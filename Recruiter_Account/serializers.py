@@ -2,6 +2,37 @@
 from rest_framework import serializers
 from .models import CompanyProfile, Job, JobApplication
 
+
+class SparseFieldsetMixin:
+    """
+    Lets a view ask for a subset of fields with ``fields=[...]``.
+
+    ``Meta.field_sources`` maps computed fields to the model paths they read
+    (``None`` if they need the full row) and ``Meta.always_load`` lists paths
+    the view itself depends on, so the view can push the same projection
+    down to the query with ``.only()``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_projection(cls, field_names):
+        sources = getattr(cls.Meta, 'field_sources', {})
+        paths = set(getattr(cls.Meta, 'always_load', ()))
+        for name in field_names:
+            if name not in sources:
+                paths.add(name)
+            elif sources[name] is None:
+                return None
+            else:
+                paths.update(sources[name])
+        return sorted(paths)
+
 class CompanyProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = CompanyProfile
@@ -9,9 +40,9 @@ class CompanyProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ['recruiter', 'created_at', 'updated_at']
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     company_name = serializers.ReadOnlyField(source='company.name')
-    applications_count = serializers.SerializerMethodField()
+    company_logo = serializers.SerializerMethodField()
 
     class Meta:
         model = Job
@@ -19,6 +50,7 @@ class JobSerializer(serializers.ModelSerializer):
             'id',
             'company',
             'company_name',
+            'company_logo',
             'title',
             'location',
             'employment_type',
@@ -40,6 +72,28 @@ class JobSerializer(serializers.ModelSerializer):
             'qualifications',
             'applications_count',
         ]
+        # Compact projection for list cards, no unbounded text columns
+        card_fields = [
+            'id',
+            'company',
+            'company_name',
+            'company_logo',
+            'title',
+            'location',
+            'employment_type',
+            'salary_min',
+            'salary_max',
+            'remote_option',
+            'application_deadline',
+            'created_at',
+            'job_slug',
+            'applications_count',
+        ]
+        field_sources = {
+            'company_name': ['company__name'],
+            'company_logo': ['company__logo'],
+        }
+        always_load = ['id', 'created_at', 'company']
         read_only_fields = [
             'id',
             'created_at',
@@ -47,6 +101,7 @@ class JobSerializer(serializers.ModelSerializer):
             'job_slug',
             'posted_by',
             'company', 
+            'applications_count',
         ]
 
     def create(self, validated_data):
@@ -66,24 +121,44 @@ class JobSerializer(serializers.ModelSerializer):
         return job
 
     
-    def get_applications_count(self, obj):
-        return obj.applications.count()
+    def get_company_logo(self, obj):
+        request = self.context.get('request')
+        logo = obj.company.logo
+        if not logo:
+            return None
+        return request.build_absolute_uri(logo.url) if request else logo.url
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobApplicationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     candidate_name = serializers.ReadOnlyField(source='candidate.name')
     job_title = serializers.ReadOnlyField(source='job.title')
     company_logo = serializers.SerializerMethodField()
-    job_details = JobSerializer(source="job",read_only=True) 
+    # ✅ Card-sized job (counts from Job.applications_count), not the full posting
+    job_details = JobSerializer(source="job", read_only=True, fields=JobSerializer.Meta.card_fields)
     company_name = serializers.SerializerMethodField()
 
     class Meta:
         model = JobApplication
         fields = [
             'id', 'job', 'job_title', 'candidate', 'candidate_name',
-            'resume', 'applied_at', 'status', 'company_logo','job_details','company_name'
+            'resume', 'applied_at', 'status', 'company_logo','job_details','company_name',
+            'ats_score', 'hire_chance',
+        ]
+        card_fields = [
+            'id', 'job', 'job_title', 'company_name', 'company_logo', 'status', 'applied_at'
         ]
-        read_only_fields = ['id', 'candidate', 'applied_at']
+        field_sources = {
+            'job_title': ['job__title'],
+            'candidate_name': ['candidate__name'],
+            'company_logo': ['job__company__logo'],
+            'company_name': ['job__company__name'],
+            'job_details': [
+                f'job__{path}' for path in JobSerializer.get_projection(JobSerializer.Meta.card_fields)
+            ],
+        }
+        # Cursor pagination reads the ordering columns from every row
+        always_load = ['id', 'applied_at', 'ats_score']
+        read_only_fields = ['id', 'candidate', 'applied_at', 'ats_score', 'hire_chance']
 
     def validate(self, data):
         request = self.context.get("request")
@@ -97,11 +172,35 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     
     def get_company_logo(self, obj):
         request = self.context.get('request')
-        if obj.job.company.logo:
-            return request.build_absolute_uri(obj.job.company.logo.url)
-        return None
+        logo = obj.job.company.logo
+        if not logo:
+            return None
+        return request.build_absolute_uri(logo.url) if request else logo.url
     def get_company_name(self, obj):
         # obj.job is the related Job object
         if obj.job and obj.job.company and obj.job.company.name:
             return obj.job.company.name
-        return None
\ No newline at end of file
+        return None
+
+
+class BulkStatusFilterSerializer(serializers.Serializer):
+    job = serializers.IntegerField(required=False)
+    status = serializers.ChoiceField(choices=JobApplication.STATUS_CHOICES, required=False)
+
+
+class BulkApplicationStatusSerializer(serializers.Serializer):
+    """Target status plus either explicit application ``ids`` or a ``filter``."""
+    MAX_IDS = 1000
+
+    status = serializers.ChoiceField(choices=JobApplication.STATUS_CHOICES)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=MAX_IDS
+    )
+    filter = BulkStatusFilterSerializer(required=False)
+
+    def validate(self, data):
+        if ('ids' in data) == ('filter' in data):
+            raise serializers.ValidationError("Provide either 'ids' or 'filter'.")
+        if 'filter' in data and not data['filter']:
+            raise serializers.ValidationError("'filter' needs a job or a status.")
+        return data
@@ -0,0 +1,129 @@
+import threading
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from Account.skills import parse_skills, resolve_skill_tags
+from .cache import bump_candidate_version, bump_company_version, bump_job_index_version, bump_jobs_version
+from .locations import location_key, location_name
+from .models import ApplicationStatusEvent, CompanyProfile, Job, JobApplication, Location
+from .search import get_search_backend
+
+# Jobs whose delete is in progress in this thread. Their applications go with them in the
+# same cascade, so per-application bookkeeping against the job is skipped.
+_deleting = threading.local()
+
+
+def _jobs_being_deleted():
+    if not hasattr(_deleting, 'job_ids'):
+        _deleting.job_ids = set()
+    return _deleting.job_ids
+
+
+@receiver(pre_delete, sender=Job)
+def mark_job_deleting(sender, instance, **kwargs):
+    _jobs_being_deleted().add(instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def unmark_job_deleting(sender, instance, **kwargs):
+    _jobs_being_deleted().discard(instance.pk)
+
+
+def _cascaded_from_job_delete(application):
+    return application.job_id in _jobs_being_deleted()
+
+
+# Connected first, so the tags are in place before the job is indexed and caches move on
+@receiver(post_save, sender=Job)
+def sync_job_skill_tags(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and 'skills_required' not in update_fields:
+        return
+    tags = resolve_skill_tags(parse_skills(instance.skills_required))
+    instance.skills.set(tags.values())
+
+
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, **kwargs):
+    get_search_backend().index([instance.pk])
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    get_search_backend().remove([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=CompanyProfile)
+@receiver(post_delete, sender=CompanyProfile)
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_job_cache(sender, instance, **kwargs):
+    if sender is JobApplication and _cascaded_from_job_delete(instance):
+        return
+    bump_jobs_version()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_recommendation_index(sender, **kwargs):
+    bump_job_index_version()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_company_cache_for_job(sender, instance, **kwargs):
+    bump_company_version(instance.company_id)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_company_cache_for_application(sender, instance, **kwargs):
+    bump_candidate_version(instance.candidate_id)
+    # The Job delete handlers bump the company once, rather than loading the job per application
+    if not _cascaded_from_job_delete(instance):
+        bump_company_version(instance.job.company_id)
+
+
+@receiver(post_save, sender=JobApplication)
+def increment_applications_count(sender, instance, created, **kwargs):
+    if created:
+        Job.objects.filter(pk=instance.job_id).update(applications_count=F('applications_count') + 1)
+
+
+@receiver(post_save, sender=JobApplication)
+def log_status_change(sender, instance, created, update_fields=None, **kwargs):
+    # Runs inside JobApplication.save()'s transaction, like the counter update
+    if update_fields is not None and 'status' not in update_fields:
+        return
+    previous = '' if created else getattr(instance, '_loaded_status', None)
+    if previous is None or previous == instance.status:
+        return
+    ApplicationStatusEvent.objects.create(
+        application=instance, job_id=instance.job_id, from_status=previous, to_status=instance.status
+    )
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=JobApplication)
+def decrement_applications_count(sender, instance, **kwargs):
+    # A job (or company) delete cascading here needs no N counter updates on a doomed row
+    if _cascaded_from_job_delete(instance):
+        return
+    Job.objects.filter(pk=instance.job_id, applications_count__gt=0).update(
+        applications_count=F('applications_count') - 1
+    )
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_save, sender=CompanyProfile)
+def normalize_location(sender, instance, **kwargs):
+    key = location_key(instance.location)
+    if not key:
+        instance.normalized_location = None
+    elif instance.normalized_location_id != key:
+        instance.normalized_location, _ = Location.objects.get_or_create(
+            key=key, defaults={'name': location_name(key)}
+        )
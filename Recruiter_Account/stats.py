@@ -0,0 +1,72 @@
+from django.db.models import Count, Q, Sum
+
+from .cache import cached_company_payload
+from .funnel import STATUSES
+from .models import Job, JobViewStats
+
+# Statuses that count as the recruiter having responded to an applicant
+PROCESSED_STATUSES = ['interviewed', 'offered', 'rejected']
+
+
+def application_totals(jobs):
+    """Jobs, applicants and per-status counts over ``jobs`` from one LEFT JOIN with conditional COUNTs."""
+    status_counts = {
+        status: Count('applications', filter=Q(applications__status=status)) for status in STATUSES
+    }
+    row = jobs.aggregate(
+        jobs_posted=Count('id', distinct=True),
+        total_applicants=Count('applications'),
+        **status_counts,
+    )
+    return row['jobs_posted'], row['total_applicants'], {status: row[status] for status in STATUSES}
+
+
+def compute_recruiter_stats(company_id):
+    """
+    Application totals for a company's jobs plus the flushed view counters
+    (a separate sum, joining them would fan out).
+    """
+    views = JobViewStats.objects.filter(job__company_id=company_id).aggregate(
+        views=Sum('views'), impressions=Sum('impressions')
+    )
+    return build_stats(
+        *application_totals(Job.objects.filter(company_id=company_id)),
+        views['views'] or 0, views['impressions'] or 0,
+    )
+
+
+def build_stats(jobs_posted, total_applicants, status_counts, job_views=0, job_impressions=0):
+    processed = sum(status_counts[status] for status in PROCESSED_STATUSES)
+    return {
+        'jobs_posted': jobs_posted,
+        'total_applicants': total_applicants,
+        'status_counts': status_counts,
+        'job_views': job_views,
+        'job_impressions': job_impressions,
+        'avg_applications_per_job': round(total_applicants / jobs_posted, 2) if jobs_posted else 0,
+        'response_rate': round(processed / total_applicants * 100, 1) if total_applicants else 0,
+    }
+
+
+def get_recruiter_stats(user):
+    """
+    Stats for the recruiter's company, cached until one of its jobs or
+    applications changes. View counters may lag by up to JOB_CACHE_TIMEOUT.
+    """
+    if not hasattr(user, 'company_profile'):
+        return build_stats(0, 0, dict.fromkeys(STATUSES, 0))
+    company_id = user.company_profile.id
+    return cached_company_payload(company_id, 'stats', lambda: compute_recruiter_stats(company_id))
+
+
+def get_dashboard_stats(user):
+    """
+    Application totals for the jobs ``user`` posted. Cached under their
+    company's version, which every change to those jobs bumps.
+    """
+    def compute():
+        return build_stats(*application_totals(Job.objects.filter(posted_by=user)))
+
+    if not hasattr(user, 'company_profile'):
+        return compute()
+    return cached_company_payload(user.company_profile.id, f'dashboard:{user.pk}', compute)
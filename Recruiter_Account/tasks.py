@@ -0,0 +1,58 @@
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from .cache import bump_job_index_version, bump_jobs_version
+from .counters import decode_counts, flush_job_view_counters, write_counts
+from .models import Job
+from .recommendations import rebuild_shared_index, shared_index_is_stale
+
+
+@shared_task
+def expire_jobs(batch_size=None):
+    """
+    Deactivate active jobs whose application deadline has passed.
+
+    Works through the partial ``job_active_deadline_idx`` index in chunks of
+    ``batch_size`` rows, each its own short UPDATE, so a large backlog never
+    holds locks on the whole table. ``.update()`` skips signals, so caches are
+    invalidated here once at the end.
+    """
+    batch_size = batch_size or settings.JOB_EXPIRY_BATCH_SIZE
+    today = timezone.localdate()
+    expired = Job.objects.filter(is_active=True, application_deadline__lt=today)
+
+    total = 0
+    while True:
+        ids = list(expired.order_by('application_deadline', 'id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        total += Job.objects.filter(id__in=ids, is_active=True).update(
+            is_active=False, updated_at=timezone.now()
+        )
+
+    if total:
+        bump_jobs_version()
+        bump_job_index_version()
+    return total
+
+
+@shared_task
+def flush_job_views():
+    """Write buffered job views and impressions to JobViewStats."""
+    return flush_job_view_counters()
+
+
+@shared_task
+def write_job_view_counts(rows):
+    """Write counts handed off by a per-process buffer (``[field, job_id, value]`` rows)."""
+    return write_counts(decode_counts(rows))
+
+
+@shared_task
+def rebuild_recommendation_index(force=False):
+    """Rebuild and publish the recommendation index when job edits have made it stale."""
+    if not force and not shared_index_is_stale():
+        return None
+    _, index = rebuild_shared_index()
+    return len(index)
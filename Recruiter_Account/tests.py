@@ -1,3 +1,839 @@
-from django.test import TestCase
+import base64
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from urllib.parse import urlencode
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from Account.models import GoogleUser, Resume, Skill, SkillTag
+from Account.skills import normalize_skill_name
+from .cache import get_company_version, get_jobs_version
+from .counters import flush_job_view_counters, get_counter_buffer
+from .models import ApplicationStatusEvent, CompanyProfile, Job, JobApplication, JobViewStats
+from .serializers import JobApplicationSerializer
+from .tasks import expire_jobs
+
+
+def make_recruiter(email="recruiter@example.com", company_name="Acme"):
+    recruiter = GoogleUser.objects.create_user(
+        email=email, name="Recruiter", password="secret123", user_type="recruiter"
+    )
+    company = CompanyProfile.objects.create(recruiter=recruiter, name=company_name)
+    return recruiter, company
+
+
+def make_job(company, title="Backend Engineer", **fields):
+    job = Job.objects.create(
+        company=company,
+        posted_by=fields.pop("posted_by", company.recruiter),
+        title=title,
+        location=fields.pop("location", "Chennai"),
+        **fields
+    )
+    job.job_slug = f"{job.title.replace(' ', '-')}-{job.id}"
+    job.save(update_fields=["job_slug"])
+    return job
+
+
+class JobListQueryCountTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+
+    def add_jobs(self, count):
+        for i in range(count):
+            job = make_job(self.company, title=f"Job {Job.objects.count()}")
+            candidate = GoogleUser.objects.create_user(
+                email=f"candidate{job.id}@example.com", name="Candidate"
+            )
+            JobApplication.objects.create(job=job, candidate=candidate)
+
+    def test_list_query_count_is_constant(self):
+        # One aggregate for the ETag validator, one for the page itself
+        self.add_jobs(2)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/recruiter/jobs/")
+        self.assertEqual(response.status_code, 200)
+
+        self.add_jobs(10)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/recruiter/jobs/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_includes_company_and_counts(self):
+        self.add_jobs(3)
+        response = self.client.get("/api/recruiter/jobs/")
+        for item in response.json()["results"]:
+            self.assertEqual(item["company_name"], "Acme")
+            self.assertIsNone(item["company_logo"])
+            self.assertEqual(item["applications_count"], 1)
+
+
+class JobKeysetPaginationTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        # Identical timestamps force the paginator to break ties on id
+        same_time = timezone.now()
+        for i in range(7):
+            make_job(self.company, title=f"Job {i}")
+        Job.objects.update(created_at=same_time)
+
+    def collect(self, url):
+        ids = []
+        while url:
+            page = self.client.get(url).json()
+            ids.extend(item["id"] for item in page["results"])
+            url = page["next"]
+        return ids
+
+    def test_pages_cover_every_row_once(self):
+        ids = self.collect("/api/recruiter/jobs/?page_size=3")
+        expected = list(Job.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_tampered_cursors_are_not_found(self):
+        for position in (["x", 1], [[1], 1], [None, 1], [timezone.now().isoformat(), "y"]):
+            cursor = base64.b64encode(urlencode({"p": json.dumps(position)}).encode()).decode()
+            response = self.client.get("/api/recruiter/jobs/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 404, position)
+
+    def test_cursor_is_stable_under_inserts(self):
+        first = self.client.get("/api/recruiter/jobs/?page_size=3").json()
+        make_job(self.company, title="Fresh job")
+        second = self.client.get(first["next"]).json()
+        seen = [item["id"] for item in first["results"] + second["results"]]
+        self.assertEqual(len(seen), len(set(seen)))
+
+        previous = self.client.get(second["previous"]).json()
+        self.assertEqual(previous["results"], first["results"])
+
+
+class JobSearchTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.python_job = make_job(self.company, title="Python Developer", skills_required="Django, SQL")
+        self.body_job = make_job(
+            self.company, title="Data Analyst", qualifications="Experience with Python notebooks"
+        )
+        make_job(self.company, title="Sales Manager", skills_required="Negotiation")
+
+    def search(self, text):
+        response = self.client.get("/api/recruiter/jobs/", {"q": text})
+        self.assertEqual(response.status_code, 200)
+        return [item["id"] for item in response.json()["results"]]
+
+    def test_results_are_ranked_by_field_weight(self):
+        self.assertEqual(self.search("python"), [self.python_job.id, self.body_job.id])
+
+    def test_document_follows_saves(self):
+        self.python_job.title = "Go Developer"
+        self.python_job.skills_required = "Go"
+        self.python_job.save()
+        self.assertEqual(self.search("python"), [self.body_job.id])
+        self.assertEqual(self.search("go developer"), [self.python_job.id])
+
+
+class JobResponseCacheTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+
+    def test_repeat_requests_are_served_from_cache(self):
+        self.client.get("/api/recruiter/jobs/", {"employment_type": "full-time"})
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/recruiter/jobs/", {"employment_type": "full-time"})
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_saving_a_job_invalidates_the_cache(self):
+        self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        self.job.title = "Platform Engineer"
+        self.job.save()
+        response = self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        self.assertEqual(response.json()["title"], "Platform Engineer")
+
+
+class CacheVersionCommitTests(TestCase):
+    def test_versions_move_only_on_commit(self):
+        recruiter, company = make_recruiter()
+        before = get_jobs_version(), get_company_version(company.id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            job = make_job(company)
+            job.title = "Renamed"
+            job.save()
+            self.assertEqual((get_jobs_version(), get_company_version(company.id)), before)
+        self.assertTrue(callbacks)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_jobs_version(), before[0])
+        self.assertNotEqual(get_company_version(company.id), before[1])
+
+
+class ApplicationsCountTests(TestCase):
+    def setUp(self):
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+        self.candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+
+    def test_counter_follows_inserts_and_deletes(self):
+        application = JobApplication.objects.create(job=self.job, candidate=self.candidate)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+        application.delete()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 0)
+
+    def test_cascades_skip_counter_updates_for_deleted_jobs(self):
+        for i in range(5):
+            candidate = GoogleUser.objects.create_user(email=f"c{i}@example.com", name="Candidate")
+            JobApplication.objects.create(job=self.job, candidate=candidate)
+        with CaptureQueriesContext(connection) as queries:
+            self.job.delete()
+        self.assertFalse([q for q in queries if q["sql"].startswith("UPDATE") and "applications_count" in q["sql"]])
+        # The job is loaded once by the collector, not again per application
+        job_reads = [q for q in queries if q["sql"].startswith('SELECT "Recruiter_Account_job"."id"')]
+        self.assertLessEqual(len(job_reads), 1)
+
+    def test_deleting_a_candidate_still_decrements(self):
+        JobApplication.objects.create(job=self.job, candidate=self.candidate)
+        self.candidate.delete()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 0)
+
+    def test_reconcile_command_repairs_drift(self):
+        JobApplication.objects.create(job=self.job, candidate=self.candidate)
+        Job.objects.filter(pk=self.job.pk).update(applications_count=7)
+        call_command("reconcile_applications_count", stdout=StringIO())
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+
+class ApplicationsFeedQueryCountTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.candidate = GoogleUser.objects.create_user(email="candidate@example.com", name="Candidate")
+
+    def add_applications(self, count):
+        for i in range(count):
+            job = make_job(self.company, title=f"Job {Job.objects.count()}", about_job="Long description")
+            JobApplication.objects.create(job=job, candidate=self.candidate)
+            other = GoogleUser.objects.create_user(email=f"other{job.id}@example.com", name="Other")
+            JobApplication.objects.create(job=job, candidate=other)
+
+    def get_feed(self, user):
+        # A fresh user per request, as token authentication would load it
+        self.client.force_authenticate(GoogleUser.objects.get(pk=user.pk))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/recruiter/applications/")
+        return response.json()["results"], len(queries)
+
+    def assert_constant_queries(self, user):
+        self.add_applications(2)
+        _, small = self.get_feed(user)
+        self.add_applications(10)
+        results, large = self.get_feed(user)
+        self.assertEqual(small, large)
+        return results
+
+    def test_recruiter_feed(self):
+        results = self.assert_constant_queries(self.recruiter)
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[0]["company_name"], "Acme")
+        self.assertEqual(results[0]["candidate_name"], "Other")
+        self.assertEqual(results[0]["job_details"]["applications_count"], 2)
+        self.assertNotIn("about_job", results[0]["job_details"])
+
+        response = self.client.get("/api/recruiter/applications/", {"fields": "id,job_details"})
+        self.assertEqual(set(response.json()["results"][0]), {"id", "job_details"})
+
+    def test_candidate_feed(self):
+        results = self.assert_constant_queries(self.candidate)
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results[0]["job_details"]["company_name"], "Acme")
+
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        make_job(self.company, about_job="Long description")
+
+    def test_card_view_skips_heavy_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/recruiter/jobs/", {"view": "card"})
+        item = response.json()["results"][0]
+        self.assertEqual(item["company_name"], "Acme")
+        self.assertNotIn("about_job", item)
+        self.assertNotIn("about_job", queries.captured_queries[0]["sql"])
+
+    def test_fields_param_selects_fields(self):
+        response = self.client.get("/api/recruiter/jobs/", {"fields": "id,title,unknown"})
+        self.assertEqual(set(response.json()["results"][0]), {"id", "title"})
+
+
+class ConditionalGetTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+
+    def test_unchanged_job_list_answers_304(self):
+        response = self.client.get("/api/recruiter/jobs/")
+        etag = response["ETag"]
+        self.assertFalse(response.has_header("Last-Modified"))
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/recruiter/jobs/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.job.title = "Renamed"
+        self.job.save()
+        response = self.client.get("/api/recruiter/jobs/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since_alone_never_answers_304(self):
+        since = "Fri, 01 Jan 2100 00:00:00 GMT"
+        self.assertEqual(self.client.get("/api/recruiter/jobs/", HTTP_IF_MODIFIED_SINCE=since).status_code, 200)
+        response = self.client.get(f"/api/recruiter/jobs/{self.job.id}/", HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+
+    def test_dashboard_changes_with_application_status(self):
+        self.client.force_authenticate(self.recruiter)
+        etag = self.client.get("/api/recruiter/insights/")["ETag"]
+        self.assertEqual(
+            self.client.get("/api/recruiter/insights/", HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+        candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        JobApplication.objects.create(job=self.job, candidate=candidate)
+        self.assertEqual(
+            self.client.get("/api/recruiter/insights/", HTTP_IF_NONE_MATCH=etag).status_code, 200
+        )
+
+
+class SkillTagTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+
+    def test_jobs_are_tagged_and_filterable(self):
+        python_job = make_job(self.company, skills_required="Python, Django;  SQL")
+        make_job(self.company, skills_required="Java")
+        self.assertEqual(
+            sorted(python_job.skills.values_list("normalized_name", flat=True)),
+            ["django", "python", "sql"],
+        )
+
+        response = self.client.get("/api/recruiter/jobs/", {"skill": ["PYTHON", "sql"]})
+        self.assertEqual([item["id"] for item in response.json()["results"]], [python_job.id])
+
+    def test_candidate_skills_share_canonical_tags(self):
+        job = make_job(self.company, skills_required="Python")
+        candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.client.force_authenticate(candidate)
+        self.client.post("/api/add/skill/", [" python "], format="json")
+
+        self.assertEqual(candidate.skill.get().tag, job.skills.get())
+        response = self.client.post("/api/add/skill/", ["Python"], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_untagged_duplicates_are_rejected(self):
+        candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.client.force_authenticate(candidate)
+        long_name = "x" * 150  # too long to tag
+        Skill.objects.bulk_create([Skill(user=candidate, skill_name="Legacy")])  # untagged legacy row
+
+        self.assertEqual(self.client.post("/api/add/skill/", [long_name], format="json").status_code, 201)
+        for names in ([long_name], ["legacy"]):
+            response = self.client.post("/api/add/skill/", names, format="json")
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("already exist", response.json()["detail"])
+
+    def test_rejected_posts_create_no_tags(self):
+        candidate = GoogleUser.objects.create_user(email="c@example.com", name="Candidate")
+        self.client.force_authenticate(candidate)
+        self.client.post("/api/add/skill/", ["Python"], format="json")
+        tags = SkillTag.objects.count()
+        response = self.client.post("/api/add/skill/", ["python", "Brand New Skill"], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(SkillTag.objects.count(), tags)
+
+    def test_meaningful_punctuation_is_kept(self):
+        self.assertNotEqual(normalize_skill_name(".NET"), normalize_skill_name("NET"))
+        self.assertEqual(normalize_skill_name("- Node.js."), "node.js")
+
+
+class JobFacetTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        make_job(self.company, location="Chennai", salary_min=250000)
+        make_job(self.company, location="Chennai", employment_type="contract", salary_min=450000)
+        make_job(self.company, location="Pune", remote_option=True, skills_required="Python")
+
+    def test_counts_every_facet_in_one_query(self):
+        with self.assertNumQueries(1):
+            facets = self.client.get("/api/recruiter/jobs/facets/").json()
+        self.assertEqual(facets["total"], 3)
+        self.assertEqual(facets["location"][0], {"value": "chennai", "label": "Chennai", "count": 2})
+        self.assertIn({"value": "contract", "count": 1}, facets["employment_type"])
+        self.assertIn({"value": True, "count": 1}, facets["remote_option"])
+        self.assertEqual(
+            facets["salary"],
+            [
+                {"value": "0-3L", "count": 1},
+                {"value": "3-6L", "count": 1},
+                {"value": "unspecified", "count": 1},
+            ],
+        )
+
+    def test_facets_follow_current_filters(self):
+        facets = self.client.get("/api/recruiter/jobs/facets/", {"q": "python"}).json()
+        self.assertEqual(facets["total"], 1)
+        self.assertEqual(facets["location"], [{"value": "pune", "label": "Pune", "count": 1}])
+
+
+class LocationNormalizationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.bangalore = make_job(self.company, location="Bangalore, KA")
+        self.bengaluru = make_job(self.company, location="Bengaluru")
+        self.chennai = make_job(self.company, location="Chennai (Hybrid)")
+
+    def test_aliases_share_a_canonical_location(self):
+        self.assertEqual(self.bangalore.normalized_location_id, "bangalore")
+        self.assertEqual(self.bengaluru.normalized_location_id, "bangalore")
+        self.assertEqual(self.bangalore.normalized_location.name, "Bangalore")
+
+    def test_filter_matches_aliases_and_substrings(self):
+        ids = {job["id"] for job in self.client.get("/api/recruiter/jobs/", {"location": "bengaluru"}).json()["results"]}
+        self.assertEqual(ids, {self.bangalore.id, self.bengaluru.id})
+
+        ids = {job["id"] for job in self.client.get("/api/recruiter/jobs/", {"location": "henn"}).json()["results"]}
+        self.assertEqual(ids, {self.chennai.id})
+
+
+class JobExpiryTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        today = timezone.localdate()
+        self.expired = [
+            make_job(self.company, title=f"Expired {i}", application_deadline=today - timedelta(days=i + 1))
+            for i in range(3)
+        ]
+        self.open = make_job(self.company, title="Open", application_deadline=today)
+        self.undated = make_job(self.company, title="Undated")
+
+    def test_expires_jobs_past_deadline_in_batches(self):
+        self.assertEqual(expire_jobs.delay(batch_size=2).get(), 3)
+        self.assertEqual(
+            set(Job.objects.filter(is_active=True).values_list("id", flat=True)),
+            {self.open.id, self.undated.id},
+        )
+        self.assertEqual(expire_jobs(), 0)
+
+    def test_listing_defaults_to_active_jobs(self):
+        self.client.get("/api/recruiter/jobs/")  # warm the cache before expiry
+        expire_jobs()
+        ids = {job["id"] for job in self.client.get("/api/recruiter/jobs/").json()["results"]}
+        self.assertEqual(ids, {self.open.id, self.undated.id})
+
+        response = self.client.get("/api/recruiter/jobs/", {"is_active": "false"})
+        self.assertEqual({job["id"] for job in response.json()["results"]}, {job.id for job in self.expired})
+
+    def test_empty_is_active_keeps_the_default(self):
+        expire_jobs()
+        live = {self.open.id, self.undated.id}
+        for value in ("", "maybe"):
+            response = self.client.get("/api/recruiter/jobs/", {"is_active": value})
+            self.assertEqual({job["id"] for job in response.json()["results"]}, live)
+            self.assertEqual(self.client.get("/api/recruiter/jobs/facets/", {"is_active": value}).json()["total"], 2)
+
+
+class BulkApplicationStatusTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+        self.applications = [
+            JobApplication.objects.create(
+                job=self.job,
+                candidate=GoogleUser.objects.create_user(email=f"c{i}@example.com", name="Candidate"),
+            )
+            for i in range(3)
+        ]
+        _, other_company = make_recruiter(email="other@example.com", company_name="Other")
+        self.foreign = JobApplication.objects.create(
+            job=make_job(other_company), candidate=self.applications[0].candidate
+        )
+        self.client.force_authenticate(self.recruiter)
+
+    def bulk(self, payload):
+        return self.client.post("/api/recruiter/applications/bulk-status/", payload, format="json")
+
+    def test_updates_owned_ids_and_reports_each(self):
+        self.applications[1].status = "shortlisted"
+        self.applications[1].save()
+        first, second, _ = self.applications
+
+        response = self.bulk({"status": "shortlisted", "ids": [first.id, second.id, self.foreign.id, 999]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["updated"], 1)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {"id": first.id, "result": "updated"},
+                {"id": second.id, "result": "unchanged"},
+                {"id": self.foreign.id, "result": "not_found"},
+                {"id": 999, "result": "not_found"},
+            ],
+        )
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, "applied")
+
+    def test_filter_selects_applications(self):
+        response = self.bulk({"status": "rejected", "filter": {"job": self.job.id, "status": "applied"}})
+        self.assertEqual(response.json()["updated"], 3)
+        self.assertEqual(JobApplication.objects.filter(status="rejected").count(), 3)
+
+    def test_rejects_bad_requests(self):
+        self.assertEqual(self.bulk({"status": "hired", "ids": [1]}).status_code, 400)
+        self.assertEqual(self.bulk({"status": "offered"}).status_code, 400)
+        self.client.force_authenticate(self.applications[0].candidate)
+        self.assertEqual(self.bulk({"status": "offered", "ids": [self.applications[0].id]}).status_code, 403)
+
+
+class ApplyTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+        self.candidate = GoogleUser.objects.create_user(email="candidate@example.com", name="Candidate")
+        self.resume = Resume.objects.create(candidate=self.candidate, file="resumes/cv.pdf")
+        self.client.force_authenticate(self.candidate)
+
+    def apply(self):
+        return self.client.post("/api/recruiter/applications/", {"job": self.job.id}, format="json")
+
+    def test_links_latest_resume(self):
+        response = self.apply()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["resume"], "http://testserver/media/resumes/cv.pdf")
+        application = JobApplication.objects.get()
+        self.assertEqual(application.source_resume, self.resume)
+        self.assertEqual(application.resume.name, "resumes/cv.pdf")
+
+    def test_reupload_keeps_the_file_applied_with(self):
+        self.apply()
+        self.resume.file = "resumes/cv-v2.pdf"
+        self.resume.ats_score = 90
+        self.resume.save()
+
+        self.client.force_authenticate(self.recruiter)
+        application = self.client.get("/api/recruiter/applications/").json()["results"][0]
+        self.assertEqual(application["resume"], "http://testserver/media/resumes/cv.pdf")
+        self.assertEqual(application["ats_score"], 0)
+
+    def test_duplicate_maps_constraint_violation(self):
+        self.apply()
+        response = self.apply()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "You have already applied for this job."})
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(self):
+        with mock.patch.object(JobApplication, "save", side_effect=IntegrityError("FOREIGN KEY constraint failed")):
+            with self.assertRaises(IntegrityError):
+                self.apply()
+
+    def test_resume_stays_writable(self):
+        self.assertFalse(JobApplicationSerializer().fields["resume"].read_only)
+
+    def test_requires_resume(self):
+        self.resume.delete()
+        self.assertEqual(self.apply().json(), {"error": "Resume upload required before applying."})
+
+
+class FunnelTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+        self.empty = make_job(self.company, title="No applicants")
+        self.applications = [
+            JobApplication.objects.create(
+                job=self.job,
+                candidate=GoogleUser.objects.create_user(email=f"c{i}@example.com", name="Candidate"),
+                status=status,
+            )
+            for i, status in enumerate(["applied", "applied", "shortlisted"])
+        ]
+        self.client.force_authenticate(self.recruiter)
+
+    def test_matrix_from_one_query_then_cache(self):
+        with self.assertNumQueries(1):
+            data = self.client.get("/api/recruiter/funnel/").json()
+        counts = {job["job"]: job["counts"] for job in data["jobs"]}
+        self.assertEqual(counts[self.job.id]["applied"], 2)
+        self.assertEqual(counts[self.job.id]["shortlisted"], 1)
+        self.assertEqual(set(counts[self.empty.id].values()), {0})
+        self.assertEqual(data["totals"]["applied"], 2)
+
+        with self.assertNumQueries(0):
+            self.client.get("/api/recruiter/funnel/")
+
+    def test_status_changes_invalidate(self):
+        self.client.get("/api/recruiter/funnel/")
+        self.client.post(
+            "/api/recruiter/applications/bulk-status/",
+            {"status": "rejected", "ids": [self.applications[0].id]},
+            format="json",
+        )
+        data = self.client.get("/api/recruiter/funnel/").json()
+        self.assertEqual(data["totals"]["rejected"], 1)
+
+        self.applications[1].status = "offered"
+        self.applications[1].save()
+        data = self.client.get("/api/recruiter/funnel/").json()
+        self.assertEqual(data["totals"]["offered"], 1)
+        self.assertEqual(data["totals"]["applied"], 0)
+
+
+class StatusEventTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        job = make_job(self.company)
+        self.applications = [
+            JobApplication.objects.create(
+                job=job, candidate=GoogleUser.objects.create_user(email=f"c{i}@example.com", name="Candidate")
+            )
+            for i in range(3)
+        ]
+        self.client.force_authenticate(self.recruiter)
+
+    def test_logs_single_and_bulk_transitions(self):
+        first = JobApplication.objects.get(pk=self.applications[0].pk)
+        first.status = "shortlisted"
+        first.save()
+        first.save()  # unchanged status, no event
+        self.client.post(
+            "/api/recruiter/applications/bulk-status/",
+            {"status": "shortlisted", "ids": [app.id for app in self.applications]},
+            format="json",
+        )
+        transitions = list(
+            ApplicationStatusEvent.objects.order_by("id").values_list("application_id", "from_status", "to_status")
+        )
+        self.assertEqual(transitions[:3], [(app.id, "", "applied") for app in self.applications])
+        self.assertEqual(
+            transitions[3:],
+            [(app.id, "applied", "shortlisted") for app in self.applications],
+        )
+
+    def test_funnel_conversion_and_median_durations(self):
+        start = timezone.now() - timedelta(days=1)
+        JobApplication.objects.update(applied_at=start)
+        self.client.post(
+            "/api/recruiter/applications/bulk-status/",
+            {"status": "shortlisted", "ids": [app.id for app in self.applications]},
+            format="json",
+        )
+        for app, hours in zip(self.applications, [2, 4, 10]):
+            ApplicationStatusEvent.objects.filter(application=app, to_status="shortlisted").update(
+                changed_at=start + timedelta(hours=hours)
+            )
+        offered = JobApplication.objects.get(pk=self.applications[0].pk)
+        offered.status = "offered"
+        offered.save()
+
+        data = self.client.get("/api/recruiter/funnel/analytics/").json()
+        stages = {stage["stage"]: stage for stage in data["funnel"]}
+        self.assertEqual(stages["applied"]["reached"], 3)
+        self.assertEqual(stages["shortlisted"]["conversion"], 100.0)
+        self.assertEqual(stages["shortlisted"]["median_hours_from_apply"], 4.0)
+        self.assertEqual(stages["offered"]["reached"], 1)
+        self.assertEqual(stages["offered"]["conversion"], 33.3)
+        self.assertEqual(data["rejected"], 0)
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company, title="Data, Engineer")
+        self.other_job = make_job(self.company, title="Designer")
+        for i, job in enumerate([self.job, self.job, self.other_job]):
+            JobApplication.objects.create(
+                job=job, candidate=GoogleUser.objects.create_user(email=f"c{i}@example.com", name=f"Candidate {i}")
+            )
+        self.client.force_authenticate(self.recruiter)
+
+    def test_streams_applicants_as_csv(self):
+        response = self.client.get("/api/recruiter/applications/export/", {"job": self.job.id})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(",")[:3], ["id", "job_id", "job_title"])
+        self.assertEqual(len(lines), 3)
+        self.assertIn('"Data, Engineer"', lines[1])
+
+    def test_streams_jobs_as_ndjson(self):
+        response = self.client.get("/api/recruiter/jobs/export/", {"output": "ndjson"})
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([row["title"] for row in rows], ["Data, Engineer", "Designer"])
+        self.assertEqual(rows[0]["company"], "Acme")
+
+        self.assertEqual(self.client.get("/api/recruiter/jobs/export/", {"output": "xml"}).status_code, 400)
+
+    def test_export_command(self):
+        out = StringIO()
+        call_command("export_jobs", output="ndjson", stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+
+class ApplicantRankingTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+        other_job = make_job(self.company, title="Other")
+        self.scores = {}
+        for i, score in enumerate([70, 90, 70, 40, 85]):
+            candidate = GoogleUser.objects.create_user(email=f"c{i}@example.com", name="Candidate")
+            application = JobApplication.objects.create(job=self.job, candidate=candidate, ats_score=score)
+            self.scores[application.id] = score
+            JobApplication.objects.create(job=other_job, candidate=candidate, ats_score=100)
+        self.client.force_authenticate(self.recruiter)
+
+    def test_pages_through_applicants_by_score(self):
+        params = {"job": self.job.id, "ordering": "-ats_score", "page_size": 2}
+        response = self.client.get("/api/recruiter/applications/", params).json()
+        ids = [item["id"] for item in response["results"]]
+        while response["next"]:
+            response = self.client.get(response["next"]).json()
+            ids += [item["id"] for item in response["results"]]
+
+        expected = sorted(self.scores, key=lambda pk: (-self.scores[pk], -pk))
+        self.assertEqual(ids, expected)
+
+    def test_min_score(self):
+        response = self.client.get(
+            "/api/recruiter/applications/", {"job": self.job.id, "ordering": "-ats_score", "min_score": 80}
+        )
+        self.assertEqual([item["ats_score"] for item in response.json()["results"]], [90, 85])
+
+    def test_apply_snapshots_resume_scores(self):
+        candidate = GoogleUser.objects.create_user(email="new@example.com", name="New")
+        Resume.objects.create(candidate=candidate, file="resumes/cv.pdf", ats_score=77, hire_chance=60)
+        self.client.force_authenticate(candidate)
+        response = self.client.post("/api/recruiter/applications/", {"job": self.job.id}, format="json")
+        self.assertEqual((response.json()["ats_score"], response.json()["hire_chance"]), (77, 60))
+
+
+class RecruiterStatsTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        job = make_job(self.company)
+        make_job(self.company, title="No applicants")
+        self.applications = [
+            JobApplication.objects.create(
+                job=job,
+                candidate=GoogleUser.objects.create_user(email=f"c{i}@example.com", name="Candidate"),
+                status=status,
+            )
+            for i, status in enumerate(["applied", "interviewed", "offered", "rejected"])
+        ]
+        self.client.force_authenticate(self.recruiter)
+
+    def test_dashboard_and_insights_are_single_cached_aggregates(self):
+        # Dashboard: one aggregate. Insights: one aggregate, one sum of the view counters
+        with self.assertNumQueries(3):
+            dashboard = self.client.get("/api/recruiter/job_count/").json()
+            insights = self.client.get("/api/recruiter/insights/").json()
+        with self.assertNumQueries(0):
+            self.client.get("/api/recruiter/job_count/")
+            self.client.get("/api/recruiter/insights/")
+        self.assertEqual(dashboard, {"jobs_posted": 2, "total_applicants": 4, "interviewed": 1, "offered": 1})
+        self.assertEqual(insights["avg_applications_per_job"], 2.0)
+        self.assertEqual(insights["response_rate"], 75.0)
+
+    def test_dashboard_counts_only_jobs_the_recruiter_posted(self):
+        colleague = GoogleUser.objects.create_user(email="colleague@example.com", name="Colleague")
+        make_job(self.company, title="Colleague's job", posted_by=colleague)
+        dashboard = self.client.get("/api/recruiter/job_count/").json()
+        self.assertEqual(dashboard["jobs_posted"], 2)
+        self.assertEqual(self.client.get("/api/recruiter/insights/").json()["avg_applications_per_job"], 1.33)
+
+    def test_status_change_invalidates(self):
+        self.client.get("/api/recruiter/job_count/")
+        application = JobApplication.objects.get(pk=self.applications[0].pk)
+        application.status = "offered"
+        application.save()
+        self.assertEqual(self.client.get("/api/recruiter/job_count/").json()["offered"], 2)
+
+
+@override_settings(JOB_VIEW_FLUSH_INTERVAL=3600)
+class JobViewTrackingTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.recruiter, self.company = make_recruiter()
+        self.job = make_job(self.company)
+        self.other = make_job(self.company, title="Other")
+        get_counter_buffer().drain()
+
+    def test_views_and_impressions_are_buffered_then_flushed(self):
+        self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        etag = self.client.get(f"/api/recruiter/jobs/{self.job.id}/")["ETag"]
+        self.client.get(f"/api/recruiter/jobs/{self.job.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.client.get("/api/recruiter/jobs/")
+        self.assertFalse(JobViewStats.objects.exists())
+
+        with self.assertNumQueries(4):  # existing jobs, then one batched upsert in a transaction
+            self.assertEqual(flush_job_view_counters(), 2)
+        self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        flush_job_view_counters()
+
+        stats = {row.job_id: (row.views, row.impressions) for row in JobViewStats.objects.all()}
+        self.assertEqual(stats, {self.job.id: (4, 1), self.other.id: (0, 1)})
+
+    def test_failed_write_keeps_counts_for_next_flush(self):
+        self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        with mock.patch("Recruiter_Account.counters.write_counts", side_effect=IntegrityError("boom")):
+            with self.assertRaises(IntegrityError):
+                flush_job_view_counters()
+        self.assertFalse(JobViewStats.objects.exists())
+
+        flush_job_view_counters()
+        self.assertEqual(JobViewStats.objects.get(job=self.job).views, 1)
+
+    @override_settings(JOB_VIEW_BUFFER_MAX_KEYS=1)
+    def test_full_local_buffer_is_handed_to_task(self):
+        with mock.patch("Recruiter_Account.tasks.write_job_view_counts.delay") as delay:
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        self.assertFalse(any("jobviewstats" in q["sql"].lower() for q in queries.captured_queries))
+        delay.assert_called_once_with([["views", self.job.id, 1]])
+        self.assertFalse(get_counter_buffer().drain())
+
+    def test_insights_report_flushed_views(self):
+        self.client.get(f"/api/recruiter/jobs/{self.job.id}/")
+        flush_job_view_counters()
+        self.client.force_authenticate(self.recruiter)
+        self.assertEqual(self.client.get("/api/recruiter/insights/").json()["job_views"], 1)
@@ -8,6 +8,7 @@ router.register('jobs', JobViewSet, basename='jobs')
 router.register('applications', JobApplicationViewSet,basename="application")
 router.register('job_count', RecruiterDashboardViewSet,basename='job_count')
 router.register("insights", RecruiterInsightsViewSet, basename="recruiter-insights")
+router.register("funnel", RecruiterFunnelViewSet, basename="recruiter-funnel")
 
 urlpatterns = [
 
@@ -1,14 +1,81 @@
 from rest_framework import viewsets, permissions,status
-from .models import CompanyProfile, Job, JobApplication
-from .serializers import CompanyProfileSerializer, JobSerializer, JobApplicationSerializer
+from rest_framework.decorators import action
+from .models import ApplicationStatusEvent, CompanyProfile, Job, JobApplication
+from .serializers import (
+    BulkApplicationStatusSerializer, CompanyProfileSerializer, JobSerializer, JobApplicationSerializer
+)
+from .pagination import JobCursorPagination, JobApplicationCursorPagination
+from .search import JobSearchFilter
+from .cache import (
+    bump_candidate_version, bump_company_version, bump_jobs_version, cached_company_payload, cached_job_payload
+)
+from .facets import compute_facets
+from .funnel import compute_funnel
+from .analytics import hiring_analytics
+from .counters import record_job_impressions, record_job_views
+from .exports import APPLICANT_COLUMNS, EXPORT_FORMATS, JOB_COLUMNS, streaming_export
+from .locations import location_key
+from .conditional import (
+    job_list_validator, job_detail_validator, recruiter_dashboard_validator, recruiter_stats_validator,
+)
+from .stats import get_dashboard_stats, get_recruiter_stats
+from Account.conditional import conditional_response
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter
 from Account.models import Resume
-from django.db.models import Count
+from Account.skills import normalize_skill_name
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Count, Sum
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+
+class SparseFieldsetViewMixin:
+    """
+    ``?fields=a,b`` or ``?view=card`` on GET requests: the serializer drops
+    the other fields and the queryset only loads the columns they read.
+    """
+
+    def get_requested_fields(self):
+        if self.request is None or self.request.method not in ('GET', 'HEAD'):
+            return None
+
+        meta = self.get_serializer_class().Meta
+        fields = self.request.query_params.get('fields')
+        if fields:
+            requested = {name.strip() for name in fields.split(',')}
+            return [name for name in meta.fields if name in requested]
+        if self.request.query_params.get('view') == 'card':
+            return list(meta.card_fields)
+        return None
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields is not None:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_requested_fields()
+        if fields is None:
+            return queryset
+
+        paths = self.get_serializer_class().get_projection(fields)
+        if paths is None:
+            return queryset
+
+        # Related columns come from the join; the FK itself must be loaded too.
+        # Joins the projection doesn't read are dropped, .only() can't defer them
+        relations = {path.rsplit('__', 1)[0] for path in paths if '__' in path}
+        for relation in list(relations):
+            parts = relation.split('__')
+            relations.update('__'.join(parts[:i]) for i in range(1, len(parts)))
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*paths, *relations)
 
 
 class CompanyProfileViewSet(viewsets.ModelViewSet):
@@ -40,13 +107,14 @@ class CompanyProfileViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = Job.objects.all().order_by('-created_at')
     serializer_class = JobSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter]
-    filterset_fields = ['location', 'employment_type', 'remote_option', 'is_active']
-    search_fields = ['title', 'skills_required', 'description']
+    pagination_class = JobCursorPagination
+    filter_backends = [DjangoFilterBackend, JobSearchFilter]
+    # ✅ location is matched in get_queryset (aliases + substring), not as an exact filter
+    filterset_fields = ['employment_type', 'remote_option', 'is_active']
 
     def perform_create(self, serializer):
         serializer.save(
@@ -55,64 +123,116 @@ class JobViewSet(viewsets.ModelViewSet):
         )
 
     def get_queryset(self):
-        queryset = Job.objects.all().order_by('-created_at')
+        # ✅ Company name/logo come from the join, counts from Job.applications_count
+        queryset = Job.objects.select_related('company').defer('search_document').order_by('-created_at')
 
         # Optional query param filters (safe for candidate view)
         location = self.request.query_params.get('location')
         employment_type = self.request.query_params.get('employment_type')
         remote_option = self.request.query_params.get('remote_option')
 
+        # ✅ Listings show live jobs unless ?is_active= asks otherwise (partial index);
+        # empty or unparseable values are ignored by the filterset, so keep the default then
+        is_active = self.request.query_params.get('is_active', '').lower()
+        if self.action in ('list', 'facets') and is_active not in ('true', 'false', '1', '0'):
+            queryset = queryset.filter(is_active=True)
+
         if location:
-            queryset = queryset.filter(location__icontains=location)
+            # ✅ 'Bengaluru' also finds 'Bangalore, KA' through the canonical key;
+            # the substring match is served by the trigram index on PostgreSQL
+            queryset = queryset.filter(
+                Q(normalized_location_id=location_key(location)) | Q(location__icontains=location)
+            )
         if employment_type:
             queryset = queryset.filter(employment_type=employment_type)
         if remote_option:
             queryset = queryset.filter(remote_option=remote_option.lower() in ['true', '1'])
 
-        # ✅ Annotate each job with application count to avoid extra queries
-        queryset = queryset.annotate(applications_count=Count('applications'))
+        # ✅ ?skill=python&skill=django -> jobs tagged with every skill (indexed join)
+        for skill in self.request.query_params.getlist('skill'):
+            queryset = queryset.filter(skills__normalized_name=normalize_skill_name(skill))
 
         return queryset
 
+    @conditional_response(job_list_validator)
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-
-        for item in data:
-            job_instance = queryset.get(id=item['id'])
-            item['company_logo'] = (
-                request.build_absolute_uri(job_instance.company.logo.url)
-                if job_instance.company.logo
-                else None
-            )
-
+        # Public listings are served from the versioned cache
+        data = cached_job_payload(
+            request, 'list', lambda: super(JobViewSet, self).list(request, *args, **kwargs).data
+        )
         return Response(data)
 
+    @conditional_response(job_detail_validator)
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        data = serializer.data
-        data['company_logo'] = (
-            request.build_absolute_uri(instance.company.logo.url)
-            if instance.company.logo
-            else None
+        data = cached_job_payload(
+            request, 'detail', lambda: super(JobViewSet, self).retrieve(request, *args, **kwargs).data,
+            kwargs.get(self.lookup_field),
         )
         return Response(data)
 
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # ✅ Counted in a buffer, flushed to JobViewStats in batches; 304s are views too
+        if self.action == 'retrieve' and response.status_code in (200, 304):
+            pk = kwargs.get(self.lookup_field)
+            if str(pk).isdigit():
+                record_job_views([int(pk)])
+        elif self.action == 'list' and response.status_code == 200:
+            results = response.data.get('results', []) if isinstance(response.data, dict) else []
+            record_job_impressions([item['id'] for item in results if 'id' in item])
+        return response
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """Facet counts for the current filters, cached per filter signature."""
+        data = cached_job_payload(
+            request, 'facets', lambda: compute_facets(self.filter_queryset(self.get_queryset()))
+        )
+        return Response(data)
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def export(self, request):
+        """Stream the recruiter's jobs as ``?output=csv`` (default) or ``ndjson``."""
+        if not hasattr(request.user, "company_profile"):
+            return Response({"detail": "Only recruiters can access this."}, status=403)
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_FORMATS:
+            return Response({"error": f"output must be one of: {', '.join(EXPORT_FORMATS)}."}, status=400)
 
-class JobApplicationViewSet(viewsets.ModelViewSet):
+        jobs = Job.objects.filter(company=request.user.company_profile)
+        return streaming_export(jobs, JOB_COLUMNS, output, 'jobs')
+
+
+class JobApplicationViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = JobApplication.objects.all()
     serializer_class = JobApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = JobApplicationCursorPagination
 
     def get_queryset(self):
         user = self.request.user
+        # ✅ Job, company and candidate come from one join; the nested job card
+        # never reads the long text columns, so they stay in the database
+        queryset = JobApplication.objects.select_related('job__company', 'candidate').defer(
+            'job__search_document', 'job__about_job', 'job__key_responsibilities', 'job__qualifications'
+        )
         if hasattr(user, "company_profile"):
             # Recruiter view: show applications for their jobs
-            return JobApplication.objects.filter(job__company=user.company_profile)
-        # Candidate view: show their own job applications
-        return JobApplication.objects.filter(candidate=user)
+            queryset = queryset.filter(job__company=user.company_profile)
+        else:
+            # Candidate view: show their own job applications
+            queryset = queryset.filter(candidate=user)
+
+        # ✅ ?job=..&min_score=..&ordering=-ats_score ranks one job's applicants off an index
+        params = self.request.query_params
+        try:
+            if params.get('job'):
+                queryset = queryset.filter(job_id=int(params['job']))
+            if params.get('min_score'):
+                queryset = queryset.filter(ats_score__gte=int(params['min_score']))
+        except ValueError:
+            raise ValidationError({"error": "job and min_score must be integers."})
+        return queryset
 
     def perform_create(self, serializer):
         user = self.request.user
@@ -121,18 +241,114 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         if hasattr(user, "company_profile"):
             raise PermissionDenied("Recruiters cannot apply for jobs.")
 
-        # 🧾 Check if resume exists
-        resume = Resume.objects.filter(candidate=user).order_by("-created_at").first()
+        # 🧾 Check if resume exists (and snapshot its file and analysis)
+        resume = (
+            Resume.objects.filter(candidate=user).order_by("-created_at")
+            .values("id", "file", "ats_score", "hire_chance").first()
+        )
         if not resume:
             raise ValidationError({"error": "Resume upload required before applying."})
 
-        # ⚠️ Prevent duplicate applications
-        job = serializer.validated_data.get("job")
-        if JobApplication.objects.filter(candidate=user, job=job).exists():
-            raise ValidationError({"error": "You have already applied for this job."})
-
-        # ✅ Save application with the candidate’s latest resume
-        serializer.save(candidate=user, resume=resume.file)
+        # ✅ Insert straight away and let unique_together (job, candidate) catch duplicates,
+        # so concurrent submits can't both pass a separate exists() check
+        try:
+            with transaction.atomic():
+                serializer.save(
+                    candidate=user,
+                    source_resume_id=resume["id"],
+                    # Re-uploads overwrite the Resume row, so the file applied with is kept here
+                    resume=serializer.validated_data.get("resume") or resume["file"],
+                    ats_score=resume["ats_score"],
+                    hire_chance=resume["hire_chance"],
+                )
+        except IntegrityError:
+            # Only the (job, candidate) constraint means a duplicate; FK/NOT NULL failures propagate
+            if JobApplication.objects.filter(job=serializer.validated_data["job"], candidate=user).exists():
+                raise ValidationError({"error": "You have already applied for this job."})
+            raise
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream applicants as ``?output=csv`` (default) or ``ndjson``, optionally ``?job=`` and ``?status=``."""
+        user = request.user
+        if not hasattr(user, "company_profile"):
+            return Response({"detail": "Only recruiters can access this."}, status=403)
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_FORMATS:
+            return Response({"error": f"output must be one of: {', '.join(EXPORT_FORMATS)}."}, status=400)
+
+        applicants = JobApplication.objects.filter(job__company=user.company_profile)
+        job = request.query_params.get('job')
+        if job:
+            if not job.isdigit():
+                return Response({"error": "job must be an id."}, status=400)
+            applicants = applicants.filter(job_id=job)
+        if request.query_params.get('status'):
+            applicants = applicants.filter(status=request.query_params['status'])
+        return streaming_export(applicants, APPLICANT_COLUMNS, output, f'applicants-{job}' if job else 'applicants')
+
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """
+        Move many applications to one status:
+        ``{"status": "shortlisted", "ids": [1, 2]}`` or
+        ``{"status": "rejected", "filter": {"job": 3, "status": "applied"}}``.
+        """
+        user = request.user
+        if not hasattr(user, "company_profile"):
+            return Response({"error": "Only recruiters can update applications."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = BulkApplicationStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        target = data['status']
+
+        # ✅ Ownership is part of the WHERE clause, foreign IDs simply don't match
+        selected = JobApplication.objects.filter(job__company=user.company_profile)
+        if 'ids' in data:
+            selected = selected.filter(id__in=data['ids'])
+        else:
+            if 'job' in data['filter']:
+                selected = selected.filter(job_id=data['filter']['job'])
+            if 'status' in data['filter']:
+                selected = selected.filter(status=data['filter']['status'])
+
+        with transaction.atomic():
+            current = {
+                pk: (value, job_id, candidate_id)
+                for pk, value, job_id, candidate_id in selected.select_for_update(of=('self',)).values_list(
+                    'id', 'status', 'job_id', 'candidate_id'
+                )
+            }
+            changed = [pk for pk, (value, _, _) in current.items() if value != target]
+            if changed:
+                # ✅ One UPDATE; .update() skips signals, so updated_at, history and caches are handled here
+                now = timezone.now()
+                JobApplication.objects.filter(id__in=changed).update(status=target, updated_at=now)
+                ApplicationStatusEvent.objects.bulk_create([
+                    ApplicationStatusEvent(
+                        application_id=pk, job_id=current[pk][1],
+                        from_status=current[pk][0], to_status=target, changed_at=now,
+                    )
+                    for pk in changed
+                ])
+
+        if changed:
+            bump_jobs_version()
+            bump_company_version(user.company_profile.id)
+            for candidate_id in {current[pk][2] for pk in changed}:
+                bump_candidate_version(candidate_id)
+
+        changed = set(changed)
+        requested = data['ids'] if 'ids' in data else sorted(current)
+        results = [
+            {
+                "id": pk,
+                "result": "updated" if pk in changed else "unchanged" if pk in current else "not_found",
+            }
+            for pk in dict.fromkeys(requested)
+        ]
+        return Response({"status": target, "updated": len(changed), "results": results})
 
     def create(self, request, *args, **kwargs):
         """Custom create to return cleaner frontend messages."""
@@ -146,27 +362,16 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
 class RecruiterDashboardViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
+    @conditional_response(recruiter_dashboard_validator)
     def list(self, request):
-        recruiter = request.user
-
-        # ✅ Recruiter’s posted jobs
-        jobs = Job.objects.filter(posted_by=recruiter)
-        total_jobs_posted = jobs.count()
-
-        # ✅ Applications for recruiter's jobs
-        applications = JobApplication.objects.filter(job__in=jobs)
-        total_applicants = applications.count()
-
-        # ✅ Interviewed & Offered
-        interviewed_count = applications.filter(status='interviewed').count()
-        offered_count = applications.filter(status='offered').count()
-
+        # ✅ Recruiter's posted jobs, one cached aggregate over jobs and applications
+        stats = get_dashboard_stats(request.user)
 
         data = {
-            "jobs_posted": total_jobs_posted,
-            "total_applicants": total_applicants,
-            "interviewed": interviewed_count,
-            "offered": offered_count,
+            "jobs_posted": stats["jobs_posted"],
+            "total_applicants": stats["total_applicants"],
+            "interviewed": stats["status_counts"]["interviewed"],
+            "offered": stats["status_counts"]["offered"],
         }
 
         return Response(data)
@@ -174,6 +379,7 @@ class RecruiterDashboardViewSet(viewsets.ViewSet):
 class RecruiterInsightsViewSet(viewsets.ViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
+    @conditional_response(recruiter_stats_validator)
     def list(self, request):
         recruiter = request.user
 
@@ -181,28 +387,34 @@ class RecruiterInsightsViewSet(viewsets.ViewSet):
         if not hasattr(recruiter, "company_profile"):
             return Response({"detail": "Only recruiters can access this."}, status=403)
 
-        # Jobs posted by recruiter
-        jobs = Job.objects.filter(company=recruiter.company_profile)
-        job_count = jobs.count()
+        stats = get_recruiter_stats(recruiter)
 
-        # Applications for these jobs
-        applications = JobApplication.objects.filter(job__in=jobs)
-        total_applications = applications.count()
+        return Response({
+            "avg_applications_per_job": stats["avg_applications_per_job"],
+            "response_rate": stats["response_rate"],
+            "job_views": stats["job_views"],
+            "job_impressions": stats["job_impressions"],
+        })
 
-        # Average applications per job
-        avg_applications_per_job = round(total_applications / job_count, 2) if job_count > 0 else 0
 
-        # Response rate = processed applications / total applications * 100
-        processed_statuses = ["interviewed", "offered", "rejected"]
-        processed_count = applications.filter(status__in=processed_statuses).count()
-        response_rate = round((processed_count / total_applications) * 100, 1) if total_applications > 0 else 0
+class RecruiterFunnelViewSet(viewsets.ViewSet):
+    permission_classes = [permissions.IsAuthenticated]
 
-        # Job reach = sum of job views (assuming Job has a 'views' field)
-        job_reach = total_applications
+    def list(self, request):
+        # Only allow recruiters (must have company_profile)
+        if not hasattr(request.user, "company_profile"):
+            return Response({"detail": "Only recruiters can access this."}, status=403)
 
-        return Response({
-            "avg_applications_per_job": avg_applications_per_job,
-            "response_rate": response_rate,
-            "job_views": job_reach
-            
-        })
\ No newline at end of file
+        company = request.user.company_profile
+        # ✅ Cached until a job or application of this company changes
+        return Response(cached_company_payload(company.id, 'funnel', lambda: compute_funnel(company)))
+
+    @action(detail=False, methods=['get'])
+    def analytics(self, request):
+        # Only allow recruiters (must have company_profile)
+        if not hasattr(request.user, "company_profile"):
+            return Response({"detail": "Only recruiters can access this."}, status=403)
+
+        company = request.user.company_profile
+        # ✅ Conversion and median stage times from the status event log
+        return Response(cached_company_payload(company.id, 'analytics', lambda: hiring_analytics(company.id)))
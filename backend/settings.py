@@ -94,6 +94,98 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+REDIS_URL = env('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds a cached job list/detail payload stays valid
+JOB_CACHE_TIMEOUT = env.int('JOB_CACHE_TIMEOUT', default=300)
+
+# How often beat checks whether job edits made the shared recommendation index stale
+RECOMMENDATION_INDEX_INTERVAL = env.int('RECOMMENDATION_INDEX_INTERVAL', default=5 * 60)
+
+# Job view/impression counters: buffered in Redis when available, else per process,
+# and written to JobViewStats every JOB_VIEW_FLUSH_INTERVAL seconds
+JOB_VIEW_BUFFER = env('JOB_VIEW_BUFFER', default='redis' if REDIS_URL else 'local')
+JOB_VIEW_FLUSH_INTERVAL = env.int('JOB_VIEW_FLUSH_INTERVAL', default=60)
+JOB_VIEW_BUFFER_MAX_KEYS = env.int('JOB_VIEW_BUFFER_MAX_KEYS', default=5000)
+
+# Profile views: repeat views by one viewer within the window are dropped, the rest
+# are buffered (Redis when available, else per process) and bulk inserted
+PROFILE_VIEW_DEDUPE_WINDOW = env.int('PROFILE_VIEW_DEDUPE_WINDOW', default=30 * 60)
+PROFILE_VIEW_BUFFER = env('PROFILE_VIEW_BUFFER', default='redis' if REDIS_URL else 'local')
+PROFILE_VIEW_FLUSH_INTERVAL = env.int('PROFILE_VIEW_FLUSH_INTERVAL', default=60)
+PROFILE_VIEW_BATCH_SIZE = env.int('PROFILE_VIEW_BATCH_SIZE', default=500)
+
+# Daily profile view rollup (Account.rollups) and raw event retention
+PROFILE_VIEW_ROLLUP_INTERVAL = env.int('PROFILE_VIEW_ROLLUP_INTERVAL', default=5 * 60)
+PROFILE_VIEW_ROLLUP_BATCH_SIZE = env.int('PROFILE_VIEW_ROLLUP_BATCH_SIZE', default=5000)
+# Rows inserted more recently than this are left for the next run, in case lower ids are still uncommitted
+PROFILE_VIEW_ROLLUP_GRACE = env.int('PROFILE_VIEW_ROLLUP_GRACE', default=60)
+PROFILE_VIEW_RETENTION_DAYS = env.int('PROFILE_VIEW_RETENTION_DAYS', default=90)
+PROFILE_VIEW_PURGE_CHUNK_SIZE = env.int('PROFILE_VIEW_PURGE_CHUNK_SIZE', default=1000)
+
+# Rows fetched per round trip by CSV/NDJSON exports
+EXPORT_CHUNK_SIZE = env.int('EXPORT_CHUNK_SIZE', default=2000)
+
+
+# Celery
+# https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+
+CELERY_BROKER_URL = env('CELERY_BROKER_URL', default=REDIS_URL or 'memory://')
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TIMEZONE = 'UTC'
+
+# Run tasks inline (no broker/worker) for local development and tests
+CELERY_TASK_ALWAYS_EAGER = env.bool('CELERY_TASK_ALWAYS_EAGER', default=not REDIS_URL)
+CELERY_TASK_EAGER_PROPAGATES = CELERY_TASK_ALWAYS_EAGER
+
+# Rows deactivated per UPDATE when expiring jobs past their application deadline
+JOB_EXPIRY_BATCH_SIZE = env.int('JOB_EXPIRY_BATCH_SIZE', default=1000)
+
+CELERY_BEAT_SCHEDULE = {
+    'expire-jobs': {
+        'task': 'Recruiter_Account.tasks.expire_jobs',
+        'schedule': env.int('JOB_EXPIRY_INTERVAL', default=15 * 60),
+    },
+    'rebuild-recommendation-index': {
+        'task': 'Recruiter_Account.tasks.rebuild_recommendation_index',
+        'schedule': RECOMMENDATION_INDEX_INTERVAL,
+    },
+    'flush-job-view-counters': {
+        'task': 'Recruiter_Account.tasks.flush_job_views',
+        'schedule': JOB_VIEW_FLUSH_INTERVAL,
+    },
+    'flush-profile-views': {
+        'task': 'Account.tasks.flush_profile_view_buffer',
+        'schedule': PROFILE_VIEW_FLUSH_INTERVAL,
+    },
+    'rollup-profile-views': {
+        'task': 'Account.tasks.rollup_profile_view_days',
+        'schedule': PROFILE_VIEW_ROLLUP_INTERVAL,
+    },
+    'purge-profile-views': {
+        'task': 'Account.tasks.purge_old_profile_views',
+        'schedule': 24 * 60 * 60,
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 